@@ -0,0 +1,390 @@
+"""
+Battery of empirical tests for uniform generators in the style of TestU01's SmallCrush, following the tests of
+Knuth's TAOCP vol. 2, section 3.3.2. Every test is a one-pass accumulator over chunks of doubles in [0, 1): the
+chunks are processed with NumPy, and only O(1) state (or a fixed histogram) is carried between chunks, so the
+battery can stream sequences of any length. Tests derive integers from the high bits of the doubles.
+"""
+
+from abc import ABC, abstractmethod
+from math import comb, factorial
+from typing import Iterable
+import numpy as np
+
+# Two-sided threshold on the p-values, as in TestU01: p < SUSPECT_P or p > 1 - SUSPECT_P fails
+SUSPECT_P = 1e-3
+# Categories of a chi-square test are pooled until every expected count reaches this value
+MIN_EXPECTED = 5.0
+
+def passed(p_value: float) -> bool:
+    """
+    :return: whether a p-value is within [SUSPECT_P, 1 - SUSPECT_P]; undefined p-values (too few samples) pass
+    """
+    return not (p_value < SUSPECT_P or p_value > 1 - SUSPECT_P)
+
+
+def _stirling2(n: int, k: int) -> int:
+    """
+    Stirling number of the second kind, the number of partitions of n elements into k non-empty sets
+    """
+    return sum((-1) ** i * comb(k, i) * (k - i) ** n for i in range(k + 1)) // factorial(k)
+
+
+def _chi_square(counts: np.ndarray, probabilities: np.ndarray) -> tuple[float, float]:
+    """
+    Chi-square test of category counts against their probabilities. Consecutive categories are pooled until
+    the expected count of each pooled category is at least MIN_EXPECTED
+    :return: the statistic and the p-value, nan if fewer than two categories remain
+    """
+    from scipy import stats
+
+    total = counts.sum()
+    pooled_counts, pooled_expected = [], []
+    count, expected = 0, 0.0
+    for c, p in zip(counts.tolist(), probabilities.tolist()):
+        count, expected = count + c, expected + total * p
+        if expected >= MIN_EXPECTED:
+            pooled_counts.append(count)
+            pooled_expected.append(expected)
+            count, expected = 0, 0.0
+    if pooled_counts:
+        pooled_counts[-1] += count
+        pooled_expected[-1] += expected
+    if len(pooled_counts) < 2:
+        return float("nan"), float("nan")
+    observed, expected = np.array(pooled_counts, dtype=np.float64), np.array(pooled_expected)
+    statistic = float(((observed - expected) ** 2 / expected).sum())
+    return statistic, float(stats.chi2.sf(statistic, len(observed) - 1))
+
+
+class BatteryTest(ABC):
+    """
+    A streaming test: update() takes the chunks of doubles in order, result() can be called at any time
+    """
+
+    name = ""
+
+    @abstractmethod
+    def update(self, chunk: np.ndarray) -> None:
+        """
+        Adds the next chunk of doubles in [0, 1)
+        """
+
+    @abstractmethod
+    def result(self) -> tuple[float, float]:
+        """
+        :return: the test statistic and its p-value
+        """
+
+
+class _GroupedTest(BatteryTest):
+    """
+    Test on consecutive non-overlapping groups of `group` values; values left over at the end of a chunk are
+    carried to the next one
+    """
+
+    group = 1
+
+    def __init__(self):
+        self.leftover = np.empty(0, dtype=np.float64)
+
+    def update(self, chunk: np.ndarray) -> None:
+        values = np.concatenate([self.leftover, chunk]) if len(self.leftover) else chunk
+        usable = len(values) - len(values) % self.group
+        self.leftover = values[usable:].copy()
+        if usable:
+            self.update_groups(values[:usable].reshape(-1, self.group))
+
+    @abstractmethod
+    def update_groups(self, groups: np.ndarray) -> None:
+        """
+        Adds a (k, group) array of consecutive groups
+        """
+
+
+class KolmogorovSmirnov(BatteryTest):
+    """
+    Kolmogorov-Smirnov test of the uniform distribution. The empirical distribution is accumulated in a
+    histogram of `bins` equal bins and compared with the uniform one at the bin edges, which bounds memory
+    and can only underestimate D, by at most the mass of one bin
+    """
+
+    name = "Kolmogorov-Smirnov"
+
+    def __init__(self, bins: int = 1 << 20):
+        self.bins = bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def update(self, chunk: np.ndarray) -> None:
+        self.counts += np.bincount((chunk * self.bins).astype(np.int64), minlength=self.bins)
+
+    def result(self) -> tuple[float, float]:
+        from scipy import stats
+
+        n = int(self.counts.sum())
+        if n == 0:
+            return float("nan"), float("nan")
+        empirical = np.cumsum(self.counts) / n
+        statistic = float(np.abs(empirical - np.arange(1, self.bins + 1) / self.bins).max())
+        return statistic, float(stats.kstwo.sf(statistic, n))
+
+
+class RunsUp(BatteryTest):
+    """
+    Knuth's runs-up test: the lengths of the ascending runs, counted as 1, ..., 5 and 6 or more, give the
+    statistic V of TAOCP 3.3.2 (G), asymptotically chi-square with 6 degrees of freedom. A run ends where
+    x[j] > x[j + 1]; the length of the run in progress and the last value are carried across chunks
+    """
+
+    name = "Runs up"
+    # Covariance coefficients a_ij and probabilities b_i of the run lengths (Knuth, TAOCP 3.3.2, eq. (11))
+    A = np.array([
+        [4529.4, 9044.9, 13568, 18091, 22615, 27892],
+        [9044.9, 18097, 27139, 36187, 45234, 55789],
+        [13568, 27139, 40721, 54281, 67852, 83685],
+        [18091, 36187, 54281, 72414, 90470, 111580],
+        [22615, 45234, 67852, 90470, 113262, 139476],
+        [27892, 55789, 83685, 111580, 139476, 172860],
+    ])
+    B = np.array([1 / 6, 5 / 24, 11 / 120, 19 / 720, 29 / 5040, 1 / 840])
+
+    def __init__(self):
+        self.counts = np.zeros(6, dtype=np.int64)
+        self.n = 0
+        self.run = 0
+        self.last = None
+
+    def _count(self, lengths: np.ndarray) -> None:
+        self.counts += np.bincount(np.minimum(lengths, 6) - 1, minlength=6)
+
+    def update(self, chunk: np.ndarray) -> None:
+        if len(chunk) == 0:
+            return
+        # Positions of the chunk where a new run starts
+        starts = np.flatnonzero(chunk[1:] < chunk[:-1]) + 1
+        if self.last is not None and chunk[0] < self.last:
+            starts = np.concatenate([[0], starts])
+        if len(starts):
+            self._count(np.concatenate([[self.run + starts[0]], np.diff(starts)]))
+            self.run = len(chunk) - int(starts[-1])
+        else:
+            self.run += len(chunk)
+        self.n += len(chunk)
+        self.last = chunk[-1]
+
+    def result(self) -> tuple[float, float]:
+        from scipy import stats
+
+        if self.n <= 6:
+            return float("nan"), float("nan")
+        counts = self.counts.copy()
+        if self.run:
+            # The run in progress is ended by the end of the sequence
+            counts[min(self.run, 6) - 1] += 1
+        deviation = counts - self.n * self.B
+        statistic = float(deviation @ self.A @ deviation / (self.n - 6))
+        return statistic, float(stats.chi2.sf(statistic, 6))
+
+
+class RunsDown(RunsUp):
+    """
+    Runs-down test: the runs-up test on the reflected sequence, where a run ends where x[j] < x[j + 1]
+    """
+
+    name = "Runs down"
+
+    def update(self, chunk: np.ndarray) -> None:
+        super().update(-chunk)
+
+
+class Gap(BatteryTest):
+    """
+    Knuth's gap test: the lengths of the gaps between consecutive values in [alpha, beta), with gaps of length
+    `limit` or more pooled. Gap r has probability p (1 - p)^r for p = beta - alpha
+    """
+
+    name = "Gap"
+
+    def __init__(self, alpha: float = 0.0, beta: float = 0.125, limit: int = 64):
+        self.alpha, self.beta, self.limit = alpha, beta, limit
+        self.counts = np.zeros(limit + 1, dtype=np.int64)
+        self.position = 0
+        # Knuth counts the first gap from the start of the sequence
+        self.last_hit = -1
+
+    def update(self, chunk: np.ndarray) -> None:
+        hits = np.flatnonzero((chunk >= self.alpha) & (chunk < self.beta)) + self.position
+        if len(hits):
+            gaps = np.diff(hits, prepend=self.last_hit) - 1
+            self.counts += np.bincount(np.minimum(gaps, self.limit), minlength=self.limit + 1)
+            self.last_hit = int(hits[-1])
+        self.position += len(chunk)
+
+    def result(self) -> tuple[float, float]:
+        p = self.beta - self.alpha
+        probabilities = p * (1 - p) ** np.arange(self.limit + 1)
+        probabilities[-1] = (1 - p) ** self.limit
+        return _chi_square(self.counts, probabilities)
+
+
+class Poker(_GroupedTest):
+    """
+    Knuth's simplified poker test: the number of distinct values among groups of 5 integers in [0, d).
+    r distinct values have probability d (d - 1) ... (d - r + 1) / d^5 * S(5, r)
+    """
+
+    name = "Poker"
+    group = 5
+
+    def __init__(self, d: int = 8):
+        super().__init__()
+        self.d = d
+        self.counts = np.zeros(self.group + 1, dtype=np.int64)
+
+    def update_groups(self, groups: np.ndarray) -> None:
+        hands = np.sort((groups * self.d).astype(np.int64), axis=1)
+        distinct = 1 + np.count_nonzero(np.diff(hands, axis=1), axis=1)
+        self.counts += np.bincount(distinct, minlength=self.group + 1)
+
+    def result(self) -> tuple[float, float]:
+        k, d = self.group, self.d
+        probabilities = np.array([factorial(d) // factorial(d - r) * _stirling2(k, r) / d ** k if r <= d else 0.0 for r in range(k + 1)])
+        return _chi_square(self.counts[1:], probabilities[1:])
+
+
+class CouponCollector(BatteryTest):
+    """
+    Knuth's coupon collector test: the lengths of the segments needed to see all of the integers in [0, d),
+    with lengths of `limit` or more pooled. Length r has probability d! / d^r * S(r - 1, d - 1).
+    Per chunk, the end of the segment starting at every position is the furthest of the next occurrences
+    of the d values, computed with reversed running minima; only the walk from segment to segment is a
+    loop. The values seen and the length of the segment in progress are carried across chunks
+    """
+
+    name = "Coupon collector"
+
+    def __init__(self, d: int = 8, limit: int = 64):
+        self.d, self.limit = d, limit
+        self.counts = np.zeros(limit + 1, dtype=np.int64)
+        self.seen = 0
+        self.length = 0
+
+    def update(self, chunk: np.ndarray) -> None:
+        n = len(chunk)
+        if n == 0:
+            return
+        values = (chunk * self.d).astype(np.int64)
+        positions = np.arange(n + 1)
+        # next_occurrence[v][i]: first j >= i with values[j] == v, or n if there is none
+        next_occurrence = np.empty((self.d, n + 1), dtype=np.int64)
+        for v in range(self.d):
+            marks = np.where(values == v, positions[:n], n)
+            next_occurrence[v, :n] = np.minimum.accumulate(marks[::-1])[::-1]
+            next_occurrence[v, n] = n
+        segment_end = next_occurrence.max(axis=0)
+
+        lengths = []
+        start = 0
+        if self.length:
+            # Finish the segment in progress with the values still missing
+            missing = [v for v in range(self.d) if not (self.seen >> v) & 1]
+            end = int(next_occurrence[missing, 0].max())
+            if end == n:
+                self._carry(next_occurrence, 0, n)
+                return
+            lengths.append(self.length + end + 1)
+            start = end + 1
+            self.seen, self.length = 0, 0
+        while start < n:
+            end = segment_end.item(start)
+            if end == n:
+                self._carry(next_occurrence, start, n)
+                break
+            lengths.append(end - start + 1)
+            start = end + 1
+        self.counts += np.bincount(np.minimum(np.array(lengths, dtype=np.int64), self.limit), minlength=self.limit + 1)
+
+    def _carry(self, next_occurrence: np.ndarray, start: int, n: int) -> None:
+        """
+        Keeps the values seen in values[start:] as the segment in progress
+        """
+        for v in range(self.d):
+            if next_occurrence[v, start] < n:
+                self.seen |= 1 << v
+        self.length += n - start
+
+    def result(self) -> tuple[float, float]:
+        d = self.d
+        probabilities = np.zeros(self.limit + 1)
+        for r in range(d, self.limit):
+            probabilities[r] = factorial(d) * _stirling2(r - 1, d - 1) / d ** r
+        probabilities[self.limit] = 1 - probabilities.sum()
+        return _chi_square(self.counts[d:], probabilities[d:])
+
+
+class Serial(_GroupedTest):
+    """
+    Serial test: the frequencies of the d^group cells of non-overlapping tuples of integers in [0, d)
+    """
+
+    def __init__(self, group: int, d: int):
+        super().__init__()
+        self.group, self.d = group, d
+        self.name = f"Serial ({group}-tuplas, d={d})"
+        self.counts = np.zeros(d ** group, dtype=np.int64)
+
+    def update_groups(self, groups: np.ndarray) -> None:
+        cells = (groups * self.d).astype(np.int64) @ (self.d ** np.arange(self.group - 1, -1, -1))
+        self.counts += np.bincount(cells, minlength=len(self.counts))
+
+    def result(self) -> tuple[float, float]:
+        return _chi_square(self.counts, np.full(len(self.counts), 1 / len(self.counts)))
+
+
+class BirthdaySpacings(_GroupedTest):
+    """
+    Marsaglia's birthday spacings test: `group` birthdays in a year of 2^bits days, taken from the high bits,
+    are sorted, and the spacings between them that repeat are counted. The total over all groups is
+    asymptotically Poisson with mean group^3 / (4 * 2^bits) per group; the mid-p-value of the total is reported
+    """
+
+    name = "Birthday spacings"
+
+    def __init__(self, group: int = 512, bits: int = 24):
+        super().__init__()
+        self.group, self.bits = group, bits
+        self.collisions = 0
+        self.groups = 0
+
+    def update_groups(self, groups: np.ndarray) -> None:
+        birthdays = np.sort((groups * (1 << self.bits)).astype(np.int64), axis=1)
+        spacings = np.sort(np.diff(birthdays, axis=1), axis=1)
+        self.collisions += int(np.count_nonzero(spacings[:, 1:] == spacings[:, :-1]))
+        self.groups += len(groups)
+
+    def result(self) -> tuple[float, float]:
+        from scipy import stats
+
+        if self.groups == 0:
+            return float("nan"), float("nan")
+        mean = self.groups * self.group ** 3 / (4 * (1 << self.bits))
+        p_value = stats.poisson.sf(self.collisions, mean) + 0.5 * stats.poisson.pmf(self.collisions, mean)
+        return float(self.collisions), float(p_value)
+
+
+def default_tests() -> list[BatteryTest]:
+    return [
+        KolmogorovSmirnov(), RunsUp(), RunsDown(), Gap(), Poker(), CouponCollector(),
+        Serial(2, 64), Serial(3, 16), BirthdaySpacings(),
+    ]
+
+
+def run_battery(chunks: Iterable[np.ndarray], tests: list[BatteryTest] = None) -> list[tuple[str, float, float]]:
+    """
+    Feeds a stream of chunks of doubles to every test of the battery in one pass
+    :return: the name, statistic and p-value of each test
+    """
+    tests = default_tests() if tests is None else tests
+    for chunk in chunks:
+        for test in tests:
+            test.update(chunk)
+    return [(test.name, *test.result()) for test in tests]
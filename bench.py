@@ -0,0 +1,286 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import benchmark
+import lcg
+
+def best_time(func, repeat):
+    """
+    Runs func `repeat` times and returns the fastest wall-clock time in seconds (see benchmark.measure)
+    """
+    return benchmark.measure(func, warmup=0, repeat=repeat, memory=False).best
+
+def bench_lcg_parallel(args):
+    """
+    Throughput of lcg.rand_float_parallel as the number of worker processes grows
+    """
+    max_workers = args.max_workers or os.cpu_count() or 1
+    print(f"Amostras: {args.count}")
+    print(f"{'Processos':>10} {'Tempo (s)':>12} {'Amostras/s':>14} {'Speedup':>8}")
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        elapsed = best_time(
+            lambda: lcg.rand_float_parallel(args.count, args.lcg_modulus, args.lcg_multiplier, args.lcg_increment, args.seed, workers),
+            args.repeat,
+        )
+        baseline = baseline or elapsed
+        print(f"{workers:>10} {elapsed:>12.6f} {args.count / elapsed:>14.0f} {baseline / elapsed:>8.2f}")
+
+def bench_lcg_modulus(args):
+    """
+    Scalar and NumPy LCG paths with a power-of-two modulus (bitmask) against the nearest odd modulus (% m)
+    """
+    from itertools import islice
+
+    power = 1 << (args.lcg_modulus.bit_length() - 1)
+    moduli = {"Potência de 2": power, "Genérico": power - 1}
+    print(f"Amostras: {args.count}")
+    print(f"{'Módulo':>14} {'m':>22} {'Escalar (s)':>12} {'NumPy (s)':>12}")
+    for label, m in moduli.items():
+        a, c, seed = args.lcg_multiplier % m, args.lcg_increment % m, args.seed % m
+        scalar = best_time(lambda: sum(1 for _ in islice(lcg.linear_congruential_generator(m, a, c, seed), args.count)), args.repeat)
+        block = best_time(lambda: lcg.lcg_block(m, a, c, seed, args.count), args.repeat)
+        print(f"{label:>14} {m:>22} {scalar:>12.6f} {block:>12.6f}")
+
+def bench_mt_random_array(args):
+    """
+    Bulk doubles from the Mersenne Twister: the random() list comprehension used by main against
+    Random.random_array (getrandbits) and the NumPy MT19937 core
+    """
+    import mt19937
+    import py_random_source_code as py_random
+
+    def list_comprehension():
+        random = py_random.Random(args.seed).random
+        return [random() for _ in range(args.count)]
+
+    variants = {
+        "[random() for _ in range(n)]": list_comprehension,
+        "Random.random_array(n)": lambda: py_random.Random(args.seed).random_array(args.count),
+        "MT19937.random_array(n)": lambda: mt19937.MT19937(args.seed).random_array(args.count),
+    }
+    print(f"Amostras: {args.count}")
+    print(f"{'Método':>30} {'Tempo (s)':>12} {'ns/amostra':>12}")
+    for label, func in variants.items():
+        elapsed = best_time(func, args.repeat)
+        print(f"{label:>30} {elapsed:>12.6f} {elapsed / args.count * 1e9:>12.1f}")
+
+def bench_mt_parallel(args):
+    """
+    Cost of the MT19937 polynomial jump, and throughput of mt19937.random_array_parallel as the number of
+    worker processes grows
+    """
+    import mt19937
+    import py_random_source_code as py_random
+
+    start = time.perf_counter()
+    mt19937.characteristic_polynomial()
+    print(f"Polinômio característico: {time.perf_counter() - start:.6f} s")
+    for exponent in (20, 30, 40, 64):
+        generator = mt19937.MT19937(args.seed)
+        start = time.perf_counter()
+        generator.jump(1 << exponent)
+        print(f"Salto de 2^{exponent}: {time.perf_counter() - start:.6f} s")
+
+    state = py_random.Random(args.seed).getstate()
+    max_workers = args.max_workers or os.cpu_count() or 1
+    print(f"Amostras: {args.count}")
+    print(f"{'Processos':>10} {'Tempo (s)':>12} {'Amostras/s':>14} {'Speedup':>8}")
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        elapsed = best_time(lambda: mt19937.random_array_parallel(state, args.count, workers), args.repeat)
+        baseline = baseline or elapsed
+        print(f"{workers:>10} {elapsed:>12.6f} {args.count / elapsed:>14.0f} {baseline / elapsed:>8.2f}")
+
+def bench_alias_choices(args):
+    """
+    Weighted sampling from a fixed weight vector: Random.choices (cumulative weights and bisect on every call)
+    against Random.alias_choices given the weights (alias table looked up in the cache on every call) and given
+    the sampler returned once by alias_sampler
+    """
+    import py_random_source_code as py_random
+
+    population = range(args.population)
+    weights = py_random.Random(args.seed).random_array(args.population).tolist()
+    sampler = py_random.alias_sampler(weights)
+    random_instance = py_random.Random(args.seed)
+    variants = {
+        "choices": lambda k: random_instance.choices(population, weights, k=k),
+        "alias_choices (cache)": lambda k: random_instance.alias_choices(population, weights, k=k),
+        "alias_choices (AliasSampler)": lambda k: random_instance.alias_choices(population, sampler, k=k),
+    }
+    print(f"Pesos: {args.population}")
+    print(f"{'Método':>30} {'k':>10} {'Tempo (s)':>12}")
+    for k in (1, 1000, args.count):
+        for label, func in variants.items():
+            print(f"{label:>30} {k:>10} {best_time(lambda: func(k), args.repeat):>12.6f}")
+
+def bench_shuffle_sample(args):
+    """
+    Random.shuffle and Random.sample against the array-backed shuffle_array (vectorized Fisher-Yates),
+    sample_array (Floyd for sparse k, partial Fisher-Yates for dense k) and reservoir_sample
+    """
+    import numpy as np
+    import py_random_source_code as py_random
+
+    random_instance = py_random.Random(args.seed)
+    n = args.count
+    variants = {
+        "shuffle(list)": lambda: random_instance.shuffle(list(range(n))),
+        "shuffle_array": lambda: random_instance.shuffle_array(np.arange(n)),
+        "sample(k = n / 100)": lambda: random_instance.sample(range(n), n // 100),
+        "sample_array(k = n / 100)": lambda: random_instance.sample_array(n, n // 100),
+        "sample(k = n / 2)": lambda: random_instance.sample(range(n), n // 2),
+        "sample_array(k = n / 2)": lambda: random_instance.sample_array(n, n // 2),
+        "reservoir_sample(k = 1000)": lambda: random_instance.reservoir_sample(iter(range(n)), 1000),
+    }
+    print(f"Tamanho: {n}")
+    print(f"{'Método':>30} {'Tempo (s)':>12}")
+    for label, func in variants.items():
+        print(f"{label:>30} {best_time(func, args.repeat):>12.6f}")
+
+def bench_ziggurat(args):
+    """
+    Ziggurat normal and exponential samplers against normalvariate (Kinderman-Monahan), gauss (Box-Muller) and
+    expovariate, one call at a time and in blocks
+    """
+    import py_random_source_code as py_random
+
+    random_instance = py_random.Random(args.seed)
+    scalar_count = min(args.count, 10**6)
+
+    def scalar(method):
+        return lambda: [method() for _ in range(scalar_count)]
+
+    variants = {
+        "normalvariate()": scalar(random_instance.normalvariate),
+        "gauss()": scalar(random_instance.gauss),
+        "normal()": scalar(random_instance.normal),
+        "expovariate()": scalar(random_instance.expovariate),
+        "exponential()": scalar(random_instance.exponential),
+    }
+    print(f"Amostras: {scalar_count}")
+    print(f"{'Método':>30} {'Tempo (s)':>12} {'ns/amostra':>12}")
+    for label, func in variants.items():
+        elapsed = best_time(func, args.repeat)
+        print(f"{label:>30} {elapsed:>12.6f} {elapsed / scalar_count * 1e9:>12.1f}")
+
+    variants = {
+        "normalvariate_array(n)": random_instance.normalvariate_array,
+        "normal_array(n)": random_instance.normal_array,
+        "expovariate_array(n)": random_instance.expovariate_array,
+        "exponential_array(n)": random_instance.exponential_array,
+    }
+    print(f"Amostras: {args.count}")
+    for label, func in variants.items():
+        elapsed = best_time(lambda: func(args.count), args.repeat)
+        print(f"{label:>30} {elapsed:>12.6f} {elapsed / args.count * 1e9:>12.1f}")
+
+def bench_bounded_integers(args):
+    """
+    Integers in [1, population] from each engine: the float scaling used before, int(random() * n) + 1,
+    against Lemire's method on the raw words (Engine.integers)
+    """
+    import engines
+    import streaming
+
+    print(f"Amostras: {args.count}, intervalo: 1 - {args.population}")
+    print(f"{'Gerador':>14} {'Escala (s)':>12} {'Lemire (s)':>12}")
+    for name in engines.ENGINES:
+        def engine():
+            return engines.create_engine(name, args.seed, args.lcg_modulus, args.lcg_multiplier, args.lcg_increment)
+
+        scaled = best_time(lambda: next(streaming.scale_chunks([engine().fill(args.count)], 1, args.population + 1)), args.repeat)
+        lemire = best_time(lambda: engine().integers(args.count, 1, args.population + 1), args.repeat)
+        print(f"{name:>14} {scaled:>12.6f} {lemire:>12.6f}")
+
+def import_times(command):
+    """
+    Runs a Python command under -X importtime
+    :return: the wall-clock time in seconds and a dict of the cumulative import time in microseconds of each
+    module imported directly by the command
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *command], capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    elapsed = time.perf_counter() - start
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented under the module that triggered them
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return elapsed, imports
+
+def bench_startup(args):
+    """
+    Startup cost of `main.py --help`: wall-clock time and the slowest top-level imports from python -X importtime.
+    With --baseline, the result is compared with a previous run saved as JSON (and saved if the file does not
+    exist); a slowdown above --tolerance exits with an error, listing the modules that started being imported
+    """
+    command = ["main.py", "--help"]
+    runs = [import_times(command) for _ in range(args.repeat)]
+    elapsed = min(run[0] for run in runs)
+    imports = min((run[1] for run in runs), key=lambda imports: sum(imports.values()))
+    print(f"Comando: python -X importtime {' '.join(command)}")
+    print(f"Tempo total: {elapsed * 1000:.1f} ms, importações: {sum(imports.values()) / 1000:.1f} ms")
+    print(f"{'Módulo':>30} {'Tempo (ms)':>12}")
+    for name, cumulative in sorted(imports.items(), key=lambda item: -item[1])[:10]:
+        print(f"{name:>30} {cumulative / 1000:>12.1f}")
+
+    if args.baseline is None:
+        return
+    if not os.path.exists(args.baseline):
+        with open(args.baseline, "w") as file:
+            json.dump({"elapsed": elapsed, "imports": imports}, file, indent=2)
+        print(f"Referência salva em {args.baseline}")
+        return
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    change = elapsed / baseline["elapsed"] - 1
+    print(f"Referência: {baseline['elapsed'] * 1000:.1f} ms ({change:+.1%})")
+    if change > args.tolerance:
+        added = sorted(set(imports) - set(baseline["imports"]), key=lambda name: -imports[name])
+        for name in added:
+            print(f"Nova importação: {name} ({imports[name] / 1000:.1f} ms)")
+        raise SystemExit(f"Regressão no tempo de inicialização acima de {args.tolerance:.0%}")
+
+BENCHMARKS = {
+    "alias-choices": bench_alias_choices,
+    "bounded-integers": bench_bounded_integers,
+    "lcg-modulus": bench_lcg_modulus,
+    "lcg-parallel": bench_lcg_parallel,
+    "mt-parallel": bench_mt_parallel,
+    "mt-random-array": bench_mt_random_array,
+    "shuffle-sample": bench_shuffle_sample,
+    "startup": bench_startup,
+    "ziggurat": bench_ziggurat,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks dos geradores de números aleatórios")
+
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS), help="Benchmark a ser executado")
+    parser.add_argument("--count", type=int, default=10**8, help="Número de números aleatórios gerados por execução")
+    parser.add_argument("--repeat", type=int, default=3, help="Número de repetições (é reportado o melhor tempo)")
+    parser.add_argument("--max_workers", type=int, required=False, help="Número máximo de processos, padrão: número de CPUs")
+    parser.add_argument("--lcg_modulus", type=int, default=2**32, help="Módulo 'm' do LCG")
+    parser.add_argument("--lcg_multiplier", type=int, default=594_156_893, help="Multiplicador 'a' do LCG")
+    parser.add_argument("--lcg_increment", type=int, default=0, help="Incremento 'c' do LCG")
+    parser.add_argument("--seed", type=int, default=123_456_789, help="Seed inicial dos algoritmos")
+    parser.add_argument("--population", type=int, default=100_000, help="Tamanho do vetor de pesos do alias-choices e do intervalo do bounded-integers")
+    parser.add_argument("--baseline", type=str, required=False, help="Arquivo JSON de referência do benchmark startup")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Aumento relativo tolerado pelo benchmark startup")
+
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+from dataclasses import asdict, dataclass, replace
+from typing import Callable, Optional
+import gc
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+DEFAULT_WARMUP = 1
+DEFAULT_REPEAT = 5
+# Percentiles of the run times reported by Measurement.to_dict
+PERCENTILES = (10, 50, 90)
+
+def rss_high_water() -> Optional[int]:
+    """
+    :return: the peak resident set size of the process so far in bytes, or None where resource is unavailable
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass(frozen=True)
+class Measurement:
+    # Wall-clock time of each timed run, in seconds
+    times: tuple[float, ...]
+    # Samples produced per run, for the throughput
+    samples: int = 1
+    # Peak of the allocations traced by tracemalloc, in bytes
+    traced_peak: Optional[int] = None
+    # RSS high-water mark of the process after the measured code, and how much the code raised it, in bytes
+    rss_high_water: Optional[int] = None
+    rss_growth: Optional[int] = None
+
+    @property
+    def median(self) -> float:
+        return float(np.median(self.times))
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    def percentile(self, q: float) -> float:
+        return float(np.percentile(self.times, q))
+
+    @property
+    def ns_per_sample(self) -> float:
+        return self.median / self.samples * 1e9
+
+    def to_dict(self) -> dict:
+        """
+        :return: the measurement and its derived figures, JSON serializable
+        """
+        return {
+            **asdict(self), "times": list(self.times), "median": self.median, "best": self.best,
+            "percentiles": {str(q): self.percentile(q) for q in PERCENTILES}, "ns_per_sample": self.ns_per_sample,
+        }
+
+
+class MemoryTracker:
+    """
+    Context manager measuring the peak of the allocations traced by tracemalloc (NumPy buffers included) and
+    the growth of the RSS high-water mark over a block of code. Tracing slows allocations down, so it is kept
+    apart from timed code
+    """
+
+    def __enter__(self) -> "MemoryTracker":
+        self.rss_before = rss_high_water()
+        self.started = not tracemalloc.is_tracing()
+        if self.started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _, self.traced_peak = tracemalloc.get_traced_memory()
+        if self.started:
+            tracemalloc.stop()
+        self.rss_high_water = rss_high_water()
+        self.rss_growth = None if self.rss_before is None else self.rss_high_water - self.rss_before
+
+    def apply(self, measurement: Measurement) -> Measurement:
+        """
+        :return: the measurement with the memory figures of this tracker
+        """
+        return replace(measurement, traced_peak=self.traced_peak, rss_high_water=self.rss_high_water, rss_growth=self.rss_growth)
+
+
+def measure(func: Callable, samples: int = 1, warmup: int = DEFAULT_WARMUP, repeat: int = DEFAULT_REPEAT,
+            setup: Optional[Callable] = None, memory: bool = True) -> Measurement:
+    """
+    Times func over `repeat` runs after `warmup` untimed ones. Only the call of func is inside the timed region:
+    setup() runs before each call (its result is passed to func), the garbage collector runs before each call
+    and is disabled during it, and memory is measured in one extra untimed run under MemoryTracker
+    :param samples: the samples produced by one call of func, for the throughput in ns per sample
+    :param memory: whether to make the memory run
+    """
+    def call():
+        return func(setup()) if setup is not None else func()
+
+    for _ in range(warmup):
+        call()
+    times = []
+    gc_enabled = gc.isenabled()
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            func(argument) if setup is not None else func()
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            if gc_enabled:
+                gc.enable()
+        times.append(elapsed / 1e9)
+    measurement = Measurement(tuple(times), samples)
+    if memory:
+        with MemoryTracker() as tracker:
+            call()
+        measurement = tracker.apply(measurement)
+    return measurement
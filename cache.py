@@ -0,0 +1,134 @@
+from typing import Callable, Iterator, Optional
+import hashlib
+import json
+import os
+import numpy as np
+
+# Bumped whenever the cached sequences of an algorithm would change for the same parameters
+CACHE_VERSION = 2
+DEFAULT_CACHE_SIZE_MIB = 1024
+
+class SequenceCache:
+    """
+    Directory of generated sequences stored as .npy files, keyed by a hash of the generator parameters.
+    Hits are memory-mapped read-only (zero-copy) and the total size is bounded with LRU eviction,
+    using the file modification time as the last access time
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_CACHE_SIZE_MIB * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.evict()
+
+    def path(self, params: dict) -> str:
+        """
+        :param params: the generator parameters, e.g. {"algorithm": "lcg", "m": ..., "a": ..., "c": ..., "seed": ..., "n": ...}
+        :return: the path of the .npy file holding the sequence for params
+        """
+        key = json.dumps({"version": CACHE_VERSION, **params}, sort_keys=True)
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + ".npy")
+
+    def get(self, params: dict) -> Optional[np.ndarray]:
+        """
+        :return: a read-only memory map of the cached sequence, or None on a cache miss
+        """
+        path = self.path(params)
+        try:
+            sequence = np.load(path, mmap_mode="r")
+        except (FileNotFoundError, ValueError):
+            return None
+        os.utime(path)
+        return sequence
+
+    def contains(self, params: dict, n_samples: int) -> bool:
+        """
+        :return: whether the whole sequence of n_samples for params is cached
+        """
+        cached = self.get(params)
+        return cached is not None and len(cached) == n_samples
+
+    def chunks(self, params: dict, n_samples: int, chunk_size: int, generate: Callable[[], Iterator[np.ndarray]]) -> Iterator[np.ndarray]:
+        """
+        Streams the sequence for params in chunks. On a hit the chunks are slices of the memory map; on a miss
+        the chunks produced by generate() are written to the cache as they are yielded, and the file only
+        becomes visible once the whole sequence has been consumed. A sequence larger than the whole cache is
+        streamed without being written, since it would only be evicted again along with every other entry
+        :param n_samples: the length of the sequence
+        :param generate: a callable returning the chunks of the sequence
+        """
+        cached = self.get(params)
+        if cached is not None and len(cached) == n_samples:
+            for start in range(0, n_samples, chunk_size):
+                yield cached[start:start + chunk_size]
+            return
+
+        path = self.path(params)
+        partial = f"{path}.{os.getpid()}.partial"
+        sequence = None
+        complete = False
+        try:
+            offset = 0
+            chunks = iter(generate())
+            for chunk in chunks:
+                if sequence is None:
+                    if n_samples * chunk.dtype.itemsize > self.max_bytes:
+                        yield chunk
+                        yield from chunks
+                        return
+                    sequence = np.lib.format.open_memmap(partial, mode="w+", dtype=chunk.dtype, shape=(n_samples,))
+                sequence[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+                yield chunk
+            complete = sequence is not None and offset == n_samples
+            if complete:
+                sequence.flush()
+        finally:
+            del sequence
+            if complete:
+                os.replace(partial, path)
+                self.evict()
+            elif os.path.exists(partial):
+                os.remove(partial)
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used sequences until the cache fits in max_bytes
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".npy"):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+
+def _test() -> None:
+    import tempfile
+
+    def generate(n_samples, chunk_size):
+        return lambda: (np.arange(start, min(start + chunk_size, n_samples)) for start in range(0, n_samples, chunk_size))
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = SequenceCache(directory, max_bytes=8 * 1000)
+        small = {"algorithm": "test", "n": 500}
+        assert np.array_equal(np.concatenate(list(cache.chunks(small, 500, 128, generate(500, 128)))), np.arange(500))
+        assert cache.contains(small, 500)
+        assert np.array_equal(np.concatenate(list(cache.chunks(small, 500, 128, generate(0, 128)))), np.arange(500))
+
+        # A sequence larger than the cache is streamed whole, without writing it or evicting the other entries
+        large = {"algorithm": "test", "n": 2000}
+        assert np.array_equal(np.concatenate(list(cache.chunks(large, 2000, 128, generate(2000, 128)))), np.arange(2000))
+        assert not cache.contains(large, 2000)
+        assert cache.contains(small, 500)
+        assert sorted(os.listdir(directory)) == [os.path.basename(cache.path(small))]
+    print("cache: ok")
+
+
+if __name__ == "__main__":
+    _test()
@@ -0,0 +1,52 @@
+from typing import Optional
+import json
+import os
+import time
+import numpy as np
+
+# Bumped whenever the layout of the checkpoints of main.run_test_cases changes
+CHECKPOINT_VERSION = 1
+DEFAULT_INTERVAL_SECONDS = 60.0
+
+class Checkpoint:
+    """
+    Periodic checkpoint of a long run, stored as an uncompressed .npz file: the metadata as JSON plus raw
+    arrays (histograms, binary engine snapshots). Saves go to a temporary file that is then renamed, so an
+    interrupted save never corrupts the previous checkpoint
+    """
+
+    def __init__(self, path: str, interval: float = DEFAULT_INTERVAL_SECONDS):
+        self.path = path
+        self.interval = interval
+        self.saved_at = time.monotonic()
+
+    def due(self) -> bool:
+        """
+        :return: whether `interval` seconds have passed since the last save
+        """
+        return time.monotonic() - self.saved_at >= self.interval
+
+    def save(self, meta: dict, arrays: dict[str, np.ndarray]) -> None:
+        partial_path = self.path + ".partial"
+        encoded = np.frombuffer(json.dumps({"version": CHECKPOINT_VERSION, **meta}).encode(), dtype=np.uint8)
+        with open(partial_path, "wb") as f:
+            np.savez(f, meta=encoded, **arrays)
+        os.replace(partial_path, self.path)
+        self.saved_at = time.monotonic()
+
+    def load(self) -> Optional[tuple[dict, dict[str, np.ndarray]]]:
+        """
+        :return: the metadata and the arrays of the last save, or None if there is no checkpoint
+        """
+        if not os.path.exists(self.path):
+            return None
+        with np.load(self.path) as data:
+            arrays = {key: data[key] for key in data.files}
+        meta = json.loads(arrays.pop("meta").tobytes())
+        if meta.pop("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Versão de checkpoint incompatível: {self.path}")
+        return meta, arrays
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
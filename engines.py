@@ -0,0 +1,671 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Iterator
+import struct
+import numpy as np
+import gf2
+import lcg
+import mt19937
+import py_random_source_code as py_random
+
+MASK64 = (1 << 64) - 1
+MASK128 = (1 << 128) - 1
+# Scale of the 53-bit construction of doubles from 64-bit words, (w >> 11) * 2**-53
+_DOUBLE_SCALE = 2.0 ** -53
+# Binary snapshots start with the magic, the format version and the engine id, followed by the state words
+SNAPSHOT_MAGIC = b"RNGS"
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<4sHH")
+
+def _lemire(words: np.ndarray, word_range: int, bound: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Lemire's multiply-and-reject method for words uniform in [0, word_range) and 0 < bound <= word_range:
+    word * bound // word_range is uniform in [0, bound) once the words whose product leaves a remainder below
+    word_range % bound are rejected, fewer than bound out of every word_range words. For power-of-two word
+    ranges the quotient and remainder are a shift and a mask, so no division is done per word
+    :return: the int64 candidates and the mask of accepted words
+    """
+    threshold = word_range % bound
+    if words.dtype != object and word_range * bound <= 1 << 64 and word_range < 1 << 64:
+        product = words.astype(np.uint64, copy=False) * np.uint64(bound)
+        if word_range & (word_range - 1) == 0:
+            remainders = product & np.uint64(word_range - 1)
+            product >>= np.uint64(word_range.bit_length() - 1)
+            values = product
+        else:
+            values, remainders = np.divmod(product, np.uint64(word_range))
+        return values.view(np.int64), remainders >= np.uint64(threshold)
+    # Products beyond 64 bits are computed with Python ints
+    product = words.astype(object) * bound
+    return (product // word_range).astype(np.int64), (product % word_range >= threshold).astype(bool)
+
+
+def _to_words(values: tuple[int, ...], limbs: int) -> np.ndarray:
+    """
+    Splits non-negative integers into `limbs` 64-bit words each, least significant word first
+    """
+    return np.array([(v >> (64 * i)) & MASK64 for v in values for i in range(limbs)], dtype=np.uint64)
+
+
+def _from_words(words: np.ndarray, limbs: int) -> tuple[int, ...]:
+    """
+    Inverse of _to_words
+    """
+    values = [int(w) for w in words]
+    return tuple(
+        sum(w << (64 * i) for i, w in enumerate(values[start:start + limbs])) for start in range(0, len(values), limbs)
+    )
+
+
+def _parse_snapshot(snapshot: bytes) -> tuple[int, memoryview]:
+    """
+    Checks the header of a snapshot
+    :return: the engine id and the state words
+    """
+    if len(snapshot) < _SNAPSHOT_HEADER.size:
+        raise ValueError("snapshot is too short")
+    magic, version, engine_id = _SNAPSHOT_HEADER.unpack_from(snapshot)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("not an engine snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+    return engine_id, memoryview(snapshot)[_SNAPSHOT_HEADER.size:]
+
+
+class Engine(ABC):
+    """
+    Common interface of the generators compared by main.run_test_cases. Engines produce doubles in [0, 1)
+    one at a time with next() or in bulk with fill(n), bounded integers from their raw output words with
+    integers(n, start, stop), can skip ahead with jump(k), and expose their state with getstate()/setstate()
+    """
+
+    # Registry key, label used in the printed statistics and title used in the plots
+    name = ""
+    label = ""
+    title = ""
+    # The raw words of fill_raw are uniform in [0, word_range)
+    word_range = 1 << 32
+    # Identifies the engine in binary snapshots, and the type of the words its state is stored in
+    engine_id = 0
+    state_dtype = np.uint64
+
+    def params(self) -> dict:
+        """
+        :return: the parameters that, together with the seed, identify the stream (used as cache key)
+        """
+        return {}
+
+    @abstractmethod
+    def next(self) -> float:
+        """
+        :return: the next double in [0, 1)
+        """
+
+    @abstractmethod
+    def fill(self, n: int) -> np.ndarray:
+        """
+        :return: a float64 array with the next n doubles, equal to n calls of next()
+        """
+
+    @abstractmethod
+    def fill_raw(self, n: int) -> np.ndarray:
+        """
+        :return: an array with the next n raw output words, uniform in [0, word_range)
+        """
+
+    @abstractmethod
+    def jump(self, k: int) -> None:
+        """
+        Advances the engine as if next() had been called k times
+        """
+
+    @abstractmethod
+    def getstate(self):
+        """
+        :return: the internal state, which can be passed to setstate() later
+        """
+
+    @abstractmethod
+    def setstate(self, state) -> None:
+        """
+        Restores the internal state from an object returned by getstate()
+        """
+
+    @abstractmethod
+    def state_words(self) -> np.ndarray:
+        """
+        :return: the internal state as an array of state_dtype words
+        """
+
+    @abstractmethod
+    def set_state_words(self, words: np.ndarray) -> None:
+        """
+        Restores the internal state from an array returned by state_words()
+        """
+
+    def snapshot(self) -> bytes:
+        """
+        :return: a compact binary snapshot of the state: the header (magic, version and engine id) followed by
+        the raw state words in little-endian order
+        """
+        words = self.state_words().astype(np.dtype(self.state_dtype).newbyteorder("<"), copy=False)
+        return _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.engine_id) + words.tobytes()
+
+    def restore(self, snapshot: bytes) -> None:
+        """
+        Restores the state from a snapshot() of an engine of the same type
+        """
+        engine_id, payload = _parse_snapshot(snapshot)
+        if engine_id != self.engine_id:
+            raise ValueError(f"snapshot of engine id {engine_id} cannot be restored into {self.name}")
+        words = np.frombuffer(payload, dtype=np.dtype(self.state_dtype).newbyteorder("<"))
+        self.set_state_words(words.astype(self.state_dtype))
+
+    def chunks(self, n_samples: int, chunk_size: int) -> Iterator[np.ndarray]:
+        """
+        Streams the next n_samples doubles in arrays of at most chunk_size elements
+        """
+        for start in range(0, n_samples, chunk_size):
+            yield self.fill(min(chunk_size, n_samples - start))
+
+    def integers(self, n: int, start: int, stop: int) -> np.ndarray:
+        """
+        Unbiased bounded integers from the raw words with Lemire's method (see _lemire). Like
+        Random._randbelow, a rejected word is replaced by the next one, and only the missing count is redrawn,
+        so the values come in the order, and consume the words, of drawing them one at a time
+        :return: an int64 array with n integers uniform in [start, stop)
+        """
+        bound = stop - start
+        if not 0 < bound <= self.word_range:
+            raise ValueError(f"stop - start must be between 1 and {self.word_range}")
+        result = np.empty(n, dtype=np.int64)
+        filled = 0
+        while filled < n:
+            values, accepted = _lemire(self.fill_raw(n - filled), self.word_range, bound)
+            if not accepted.all():
+                values = values[accepted]
+            result[filled:filled + len(values)] = values
+            filled += len(values)
+        return result + start
+
+    def integer_chunks(self, n_samples: int, chunk_size: int, start: int, stop: int) -> Iterator[np.ndarray]:
+        """
+        Streams the next n_samples integers of integers(n, start, stop) in arrays of at most chunk_size elements
+        """
+        for offset in range(0, n_samples, chunk_size):
+            yield self.integers(min(chunk_size, n_samples - offset), start, stop)
+
+
+class WordEngine(Engine):
+    """
+    Engine built on 64-bit output words, turned into doubles with the 53 high bits
+    """
+
+    @abstractmethod
+    def next_word(self) -> int:
+        """
+        :return: the next 64-bit output word
+        """
+
+    @abstractmethod
+    def fill_words(self, n: int) -> np.ndarray:
+        """
+        :return: a uint64 array with the next n output words
+        """
+
+    def next(self) -> float:
+        return (self.next_word() >> 11) * _DOUBLE_SCALE
+
+    def fill(self, n: int) -> np.ndarray:
+        return (self.fill_words(n) >> np.uint64(11)).astype(np.float64) * _DOUBLE_SCALE
+
+    def fill_raw(self, n: int) -> np.ndarray:
+        # The high halves of the words keep the products of Lemire's method within uint64
+        return self.fill_words(n) >> np.uint64(32)
+
+
+def _splitmix64_mix(z):
+    """
+    SplitMix64 output function, for Python ints and uint64 arrays alike
+    """
+    if isinstance(z, np.ndarray):
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+class SplitMix64(WordEngine):
+    """
+    SplitMix64 (Steele, Lea and Flood). The state is a Weyl sequence, so the i-th state is seed + i * gamma
+    and both fill and jump are direct
+    """
+
+    name = "splitmix64"
+    label = "SplitMix64"
+    title = "SplitMix64"
+    engine_id = 5
+    GAMMA = 0x9E3779B97F4A7C15
+
+    def __init__(self, seed: int):
+        self.state = seed & MASK64
+
+    def next_word(self) -> int:
+        self.state = (self.state + self.GAMMA) & MASK64
+        return _splitmix64_mix(self.state)
+
+    def fill_words(self, n: int) -> np.ndarray:
+        states = np.arange(1, n + 1, dtype=np.uint64) * np.uint64(self.GAMMA) + np.uint64(self.state)
+        self.jump(n)
+        return _splitmix64_mix(states)
+
+    def jump(self, k: int) -> None:
+        self.state = (self.state + k * self.GAMMA) & MASK64
+
+    def getstate(self) -> int:
+        return self.state
+
+    def setstate(self, state: int) -> None:
+        self.state = state
+
+    def state_words(self) -> np.ndarray:
+        return np.array([self.state], dtype=np.uint64)
+
+    def set_state_words(self, words: np.ndarray) -> None:
+        self.state = int(words[0])
+
+
+def _rotl(x, k: int):
+    if isinstance(x, np.ndarray):
+        return (x << np.uint64(k)) | (x >> np.uint64(64 - k))
+    return ((x << k) | (x >> (64 - k))) & MASK64
+
+
+def _xoshiro256_step(s):
+    """
+    State transition of xoshiro256, applied in place to a list of four Python ints or uint64 arrays
+    """
+    t = s[1] << 17
+    if not isinstance(t, np.ndarray):
+        t &= MASK64
+    s[2] ^= s[0]
+    s[3] ^= s[1]
+    s[1] ^= s[2]
+    s[0] ^= s[3]
+    s[2] ^= t
+    s[3] = _rotl(s[3], 45)
+
+
+@lru_cache(maxsize=None)
+def _xoshiro256_polynomial() -> int:
+    """
+    Characteristic polynomial of the xoshiro256 transition, recovered from one state bit with Berlekamp-Massey
+    """
+    s = [1, 2, 3, 4]
+    bits = []
+    for _ in range(512):
+        bits.append(s[0] & 1)
+        _xoshiro256_step(s)
+    return gf2.berlekamp_massey(bits)
+
+
+def _xoshiro256_jump(s: list, k: int) -> list:
+    """
+    State of xoshiro256 k steps after s, for a list of Python ints or of uint64 arrays (one jump per lane),
+    evaluating (x^k mod P)(T) s with Horner's rule
+    """
+    jump = gf2.x_power_mod(k, _xoshiro256_polynomial())
+    acc = [np.zeros_like(x) if isinstance(x, np.ndarray) else 0 for x in s]
+    for i in range(jump.bit_length() - 1, -1, -1):
+        _xoshiro256_step(acc)
+        if (jump >> i) & 1:
+            acc = [x ^ y for x, y in zip(acc, s)]
+    return acc
+
+
+class Xoshiro256StarStar(WordEngine):
+    """
+    xoshiro256** (Blackman and Vigna), seeded with SplitMix64 as recommended by the authors. Bulk fills run
+    `lanes` interleaved copies of the state, each placed at its own offset of the stream with polynomial
+    jump-ahead, and step all lanes at once
+    """
+
+    name = "xoshiro256**"
+    label = "xoshiro256**"
+    title = "xoshiro256**"
+    engine_id = 4
+    # Fills shorter than this are generated with the scalar recurrence
+    MIN_VECTOR_FILL = 1 << 14
+    MAX_LANES = 1 << 12
+
+    def __init__(self, seed: int):
+        seeder = SplitMix64(seed)
+        self.s = [seeder.next_word() for _ in range(4)]
+
+    def next_word(self) -> int:
+        s = self.s
+        result = (_rotl((s[1] * 5) & MASK64, 7) * 9) & MASK64
+        _xoshiro256_step(s)
+        return result
+
+    def fill_words(self, n: int) -> np.ndarray:
+        if n < self.MIN_VECTOR_FILL:
+            return np.array([self.next_word() for _ in range(n)], dtype=np.uint64)
+
+        lanes = min(self.MAX_LANES, n // 64)
+        steps = -(-n // lanes)
+        # Lane j starts at position j * steps; the lane starts are built by doubling the number of lanes
+        starts = [np.array([x], dtype=np.uint64) for x in self.s]
+        while len(starts[0]) < lanes:
+            jumped = _xoshiro256_jump(starts, len(starts[0]) * steps)
+            starts = [np.concatenate([x, y]) for x, y in zip(starts, jumped)]
+        s = [x[:lanes].copy() for x in starts]
+
+        out = np.empty((lanes, steps), dtype=np.uint64)
+        for i in range(steps):
+            out[:, i] = _rotl(s[1] * np.uint64(5), 7) * np.uint64(9)
+            _xoshiro256_step(s)
+        self.jump(n)
+        return out.reshape(-1)[:n]
+
+    def jump(self, k: int) -> None:
+        self.s = _xoshiro256_jump(self.s, k)
+
+    def getstate(self) -> tuple:
+        return tuple(self.s)
+
+    def setstate(self, state: tuple) -> None:
+        self.s = list(state)
+
+    def state_words(self) -> np.ndarray:
+        return np.array(self.s, dtype=np.uint64)
+
+    def set_state_words(self, words: np.ndarray) -> None:
+        self.s = [int(x) for x in words]
+
+
+def _mulhi64(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    High 64 bits of the 128-bit products of uint64 arrays, from 32-bit halves
+    """
+    mask32 = np.uint64(0xFFFFFFFF)
+    shift = np.uint64(32)
+    a_lo, a_hi = a & mask32, a >> shift
+    b_lo, b_hi = b & mask32, b >> shift
+    mid1 = a_hi * b_lo + ((a_lo * b_lo) >> shift)
+    mid2 = a_lo * b_hi + (mid1 & mask32)
+    return a_hi * b_hi + (mid1 >> shift) + (mid2 >> shift)
+
+
+@lru_cache(maxsize=16)
+def _pcg64_tables(increment: int, size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Coefficients (A_j, C_j) of j = 1..size steps of the 128-bit LCG of PCG64, split in high and low words
+    """
+    mult_hi, mult_lo = np.empty(size, dtype=np.uint64), np.empty(size, dtype=np.uint64)
+    incr_hi, incr_lo = np.empty(size, dtype=np.uint64), np.empty(size, dtype=np.uint64)
+    a, c = PCG64.MULTIPLIER, increment
+    for j in range(size):
+        mult_hi[j], mult_lo[j] = a >> 64, a & MASK64
+        incr_hi[j], incr_lo[j] = c >> 64, c & MASK64
+        a, c = (a * PCG64.MULTIPLIER) & MASK128, (c * PCG64.MULTIPLIER + increment) & MASK128
+    return mult_hi, mult_lo, incr_hi, incr_lo
+
+
+class PCG64(WordEngine):
+    """
+    PCG64 (O'Neill), the XSL-RR 128/64 variant used by numpy.random.PCG64. The state is a 128-bit LCG,
+    so bulk fills evaluate it with precomputed affine coefficients in 64-bit halves and jump uses lcg.lcg_jump
+    """
+
+    name = "pcg64"
+    label = "PCG64"
+    title = "PCG64"
+    engine_id = 3
+    MULTIPLIER = 0x2360ED051FC65DA44385DF649FCCF645
+    BLOCK_SIZE = 1 << 12
+
+    def __init__(self, seed: int):
+        # pcg_setseq_128_srandom_r, with initstate and initseq drawn from SplitMix64
+        seeder = SplitMix64(seed)
+        initstate = (seeder.next_word() << 64) | seeder.next_word()
+        initseq = (seeder.next_word() << 64) | seeder.next_word()
+        self.increment = ((initseq << 1) | 1) & MASK128
+        self.state = 0
+        self._step()
+        self.state = (self.state + initstate) & MASK128
+        self._step()
+
+    def params(self) -> dict:
+        return {"increment": self.increment}
+
+    def _step(self) -> None:
+        self.state = (self.state * self.MULTIPLIER + self.increment) & MASK128
+
+    @staticmethod
+    def _output(hi, lo):
+        x = hi ^ lo
+        if isinstance(x, np.ndarray):
+            rot = hi >> np.uint64(58)
+            return (x >> rot) | (x << ((np.uint64(64) - rot) & np.uint64(63)))
+        rot = hi >> 58
+        return ((x >> rot) | (x << ((64 - rot) & 63))) & MASK64
+
+    def next_word(self) -> int:
+        self._step()
+        return self._output(self.state >> 64, self.state & MASK64)
+
+    def fill_words(self, n: int) -> np.ndarray:
+        out = np.empty(n, dtype=np.uint64)
+        mult_hi, mult_lo, incr_hi, incr_lo = _pcg64_tables(self.increment, self.BLOCK_SIZE)
+        for start in range(0, n, self.BLOCK_SIZE):
+            length = min(self.BLOCK_SIZE, n - start)
+            s_hi, s_lo = np.uint64(self.state >> 64), np.uint64(self.state & MASK64)
+            a_lo = mult_lo[:length]
+            # (A * s + C) mod 2**128 in 64-bit halves
+            lo = a_lo * s_lo
+            hi = _mulhi64(a_lo, np.full(length, s_lo)) + mult_hi[:length] * s_lo + a_lo * s_hi
+            new_lo = lo + incr_lo[:length]
+            hi = hi + incr_hi[:length] + (new_lo < lo).astype(np.uint64)
+            out[start:start + length] = self._output(hi, new_lo)
+            self.state = (int(hi[-1]) << 64) | int(new_lo[-1])
+        return out
+
+    def jump(self, k: int) -> None:
+        jump_a, jump_c = lcg.lcg_jump(1 << 128, self.MULTIPLIER, self.increment, k)
+        self.state = (jump_a * self.state + jump_c) & MASK128
+
+    def getstate(self) -> tuple[int, int]:
+        return self.state, self.increment
+
+    def setstate(self, state: tuple[int, int]) -> None:
+        self.state, self.increment = state
+
+    def state_words(self) -> np.ndarray:
+        return _to_words((self.state, self.increment), 2)
+
+    def set_state_words(self, words: np.ndarray) -> None:
+        self.state, self.increment = _from_words(words, 2)
+
+
+class LCGEngine(Engine):
+    """
+    The LCG of lcg.py behind the engine interface; doubles are x / m as in lcg.rand_float_samples
+    """
+
+    name = "lcg"
+    label = "LCG"
+    title = "LCG"
+    engine_id = 1
+
+    def __init__(self, seed: int, m: int, a: int, c: int, workers: int = 1):
+        self.generator = lcg.LCG(m, a, c, seed)
+        self.workers = workers
+
+    def params(self) -> dict:
+        return {"m": self.generator.m, "a": self.generator.a, "c": self.generator.c}
+
+    def next(self) -> float:
+        return next(self.generator) / self.generator.m
+
+    def fill(self, n: int) -> np.ndarray:
+        g = self.generator
+        floats = lcg.rand_float_parallel(n, g.m, g.a, g.c, g.state, self.workers)
+        g.skip(n)
+        return floats
+
+    @property
+    def word_range(self) -> int:
+        m = self.generator.m
+        # For power-of-two moduli above 2**32 only the 32 high bits of the states are used, the best ones
+        return 1 << 32 if m > 1 << 32 and m & (m - 1) == 0 else m
+
+    def fill_raw(self, n: int) -> np.ndarray:
+        g = self.generator
+        states = lcg.lcg_block_parallel(g.m, g.a, g.c, g.state, n, self.workers)
+        g.skip(n)
+        if self.word_range != g.m:
+            return states >> np.uint64(g.m.bit_length() - 33)
+        return states
+
+    def jump(self, k: int) -> None:
+        self.generator.skip(k)
+
+    def getstate(self) -> tuple[int, int]:
+        return self.generator.state, self.generator.position
+
+    def setstate(self, state: tuple[int, int]) -> None:
+        self.generator.state, self.generator.position = state
+
+    def state_words(self) -> np.ndarray:
+        # The parameters and the seed are part of the state, since seek() and skip() start from the seed
+        g = self.generator
+        values = (g.m, g.a, g.c, g.seed, g.state, g.position)
+        limbs = max(1, -(-max(v.bit_length() for v in values) // 64))
+        return np.concatenate([np.array([limbs], dtype=np.uint64), _to_words(values, limbs)])
+
+    def set_state_words(self, words: np.ndarray) -> None:
+        m, a, c, seed, state, position = _from_words(words[1:], int(words[0]))
+        self.generator = lcg.LCG(m, a, c, seed)
+        self.generator.state, self.generator.position = state, position
+
+
+class MTEngine(Engine):
+    """
+    The Mersenne Twister of py_random_source_code.Random behind the engine interface. Large fills are split
+    into non-overlapping substreams across workers with the polynomial jump of mt19937
+    """
+
+    name = "mt"
+    label = "MT"
+    title = "Mersenne Twister"
+    engine_id = 2
+    state_dtype = np.uint32
+    # Above this many skipped samples, the polynomial jump is faster than discarding outputs
+    MIN_POLYNOMIAL_JUMP = 1 << 24
+
+    def __init__(self, seed: int, workers: int = 1):
+        self.random_instance = py_random.Random(seed)
+        self.workers = workers
+
+    def next(self) -> float:
+        return self.random_instance.random()
+
+    def fill(self, n: int) -> np.ndarray:
+        if self.workers == 1:
+            return self.random_instance.random_array(n)
+        floats, state = mt19937.random_array_parallel(self.random_instance.getstate(), n, self.workers)
+        self.random_instance.setstate(state)
+        return floats
+
+    def fill_raw(self, n: int) -> np.ndarray:
+        if self.workers == 1:
+            return self.random_instance.getrandbits_array(n, 32)
+        words, state = mt19937.random_words_parallel(self.random_instance.getstate(), n, self.workers)
+        self.random_instance.setstate(state)
+        return words
+
+    def jump(self, k: int, chunk_size: int = 1 << 20) -> None:
+        if k >= self.MIN_POLYNOMIAL_JUMP:
+            generator = mt19937.MT19937.from_random(self.random_instance)
+            generator.jump(k)
+            self.random_instance.setstate(generator.getstate())
+            return
+        # Each random() call consumes two 32-bit words, so skipped samples are discarded in bulk
+        while k > 0:
+            skipped = min(chunk_size, k)
+            self.random_instance.getrandbits(64 * skipped)
+            k -= skipped
+
+    def getstate(self):
+        return self.random_instance.getstate()
+
+    def setstate(self, state) -> None:
+        self.random_instance.setstate(state)
+
+    def state_words(self) -> np.ndarray:
+        # The 624 words and the index, a flag telling whether gauss_next is set, and its two halves
+        _, internal_state, gauss_next = self.random_instance.getstate()
+        words = np.zeros(len(internal_state) + 3, dtype=np.uint32)
+        words[:len(internal_state)] = internal_state
+        if gauss_next is not None:
+            words[-3] = 1
+            words[-2:] = np.array([gauss_next], dtype="<f8").view("<u4")
+        return words
+
+    def set_state_words(self, words: np.ndarray) -> None:
+        gauss_next = float(words[-2:].astype("<u4").view("<f8")[0]) if words[-3] else None
+        self.random_instance.setstate((py_random.Random.VERSION, tuple(words[:-3].tolist()), gauss_next))
+
+
+ENGINES = {engine.name: engine for engine in (LCGEngine, MTEngine, PCG64, Xoshiro256StarStar, SplitMix64)}
+
+def create_engine(name: str, seed: int, lcg_modulus: int, lcg_multiplier: int, lcg_increment: int, workers: int = 1) -> Engine:
+    """
+    Builds a registered engine; the LCG parameters only apply to the LCG, and workers to the LCG and MT
+    """
+    if name == LCGEngine.name:
+        return LCGEngine(seed, lcg_modulus, lcg_multiplier, lcg_increment, workers)
+    if name == MTEngine.name:
+        return MTEngine(seed, workers)
+    return ENGINES[name](seed)
+
+
+def from_snapshot(snapshot: bytes, workers: int = 1) -> Engine:
+    """
+    Builds the engine a snapshot was taken from, in the state it was taken in
+    """
+    engine_id, _ = _parse_snapshot(snapshot)
+    names = {engine.engine_id: engine.name for engine in ENGINES.values()}
+    if engine_id not in names:
+        raise ValueError(f"unknown engine id {engine_id}")
+    # Placeholder parameters; the LCG snapshot carries its own
+    engine = create_engine(names[engine_id], 0, 2, 1, 1, workers)
+    engine.restore(snapshot)
+    return engine
+
+
+def _test() -> None:
+    # Seeds at or above the LCG modulus are reduced, so the first word and double are in range
+    for m, a, c, seed in ((2**31 - 1, 16807, 0, 3_000_000_000), (1000, 21, 7, 12345), (2**32, 594_156_893, 0, 2**40 + 5)):
+        engine = create_engine("lcg", seed, m, a, c)
+        values = np.concatenate(list(engine.integer_chunks(10_000, 1000, 1, 11)))
+        assert values.min() >= 1 and values.max() < 11, (m, seed)
+        floats = create_engine("lcg", seed, m, a, c).fill(1000)
+        assert floats.min() >= 0.0 and floats.max() < 1.0, (m, seed)
+        reduced = create_engine("lcg", seed % m, m, a, c)
+        assert np.array_equal(create_engine("lcg", seed, m, a, c).fill_raw(1000), reduced.fill_raw(1000)), (m, seed)
+
+    for name in ENGINES:
+        engine = create_engine(name, 42, 2**32, 594_156_893, 0)
+        values = engine.integers(10_000, 5, 17)
+        assert values.min() >= 5 and values.max() < 17, name
+        restored = from_snapshot(engine.snapshot())
+        assert np.array_equal(engine.fill(100), restored.fill(100)), name
+    print("engines: ok")
+
+
+if __name__ == "__main__":
+    _test()
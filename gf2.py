@@ -0,0 +1,123 @@
+"""
+Arithmetic on polynomials over GF(2), stored as Python ints (bit i is the coefficient of x^i). Used for
+jump-ahead of the GF(2)-linear generators: if P is the characteristic polynomial of the state transition T,
+then T^k = (x^k mod P)(T), which is evaluated on a state with Horner's rule.
+"""
+
+from functools import lru_cache
+import numpy as np
+
+# Spreads the bits of a byte apart: _SPREAD[b] has bit 2i set iff b has bit i set
+_SPREAD = [sum(((b >> i) & 1) << (2 * i) for i in range(8)) for b in range(256)]
+# Below this degree carry-less products are computed bit by bit
+_SLOT_MULTIPLY_DEGREE = 512
+
+def square(a: int) -> int:
+    """
+    Squares a polynomial; over GF(2) this only spreads the coefficients apart
+    """
+    data = a.to_bytes((a.bit_length() + 7) // 8 or 1, "little")
+    return int.from_bytes(b"".join(_SPREAD[b].to_bytes(2, "little") for b in data), "little")
+
+
+def _to_slots(a: int) -> int:
+    """
+    Moves coefficient i of a to bit 16 * i, so that an integer product adds up coefficients without carries
+    """
+    bits = np.unpackbits(np.frombuffer(a.to_bytes((a.bit_length() + 7) // 8, "little"), dtype=np.uint8), bitorder="little")
+    return int.from_bytes(bits.astype("<u2").tobytes(), "little")
+
+
+def multiply(a: int, b: int) -> int:
+    """
+    Carry-less product of two polynomials. Large operands are spread into 16-bit slots and multiplied as
+    integers (each slot then holds the number of contributing terms), so the product runs at big-int speed
+    """
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    if b.bit_length() < _SLOT_MULTIPLY_DEGREE or b.bit_length() >= 1 << 16:
+        result = 0
+        while b:
+            low = b & -b
+            result ^= a << (low.bit_length() - 1)
+            b ^= low
+        return result
+    product = _to_slots(a) * _to_slots(b)
+    slots = np.frombuffer(product.to_bytes((product.bit_length() + 15) // 16 * 2, "little"), dtype="<u2")
+    return int.from_bytes(np.packbits((slots & 1).astype(np.uint8), bitorder="little").tobytes(), "little")
+
+
+def _divide(a: int, p: int) -> tuple[int, int]:
+    """
+    Schoolbook division of a by p, one coefficient at a time
+    :return: the pair (quotient, remainder)
+    """
+    degree = p.bit_length() - 1
+    quotient = 0
+    while a.bit_length() - 1 >= degree:
+        shift = a.bit_length() - 1 - degree
+        quotient |= 1 << shift
+        a ^= p << shift
+    return quotient, a
+
+
+@lru_cache(maxsize=8)
+def _barrett_constant(p: int) -> int:
+    """
+    floor(x^(2d) / p) for p of degree d, which turns reduction modulo p into two products
+    """
+    degree = p.bit_length() - 1
+    return _divide(1 << (2 * degree), p)[0]
+
+
+def mod(a: int, p: int) -> int:
+    """
+    Remainder of a divided by p. Operands of degree below 2 * deg(p) are reduced with Barrett's method
+    """
+    degree = p.bit_length() - 1
+    if a.bit_length() - 1 < degree:
+        return a
+    if degree < _SLOT_MULTIPLY_DEGREE or a.bit_length() > 2 * degree:
+        return _divide(a, p)[1]
+    quotient = multiply(a >> degree, _barrett_constant(p)) >> degree
+    return a ^ multiply(quotient, p)
+
+
+def mulmod(a: int, b: int, p: int) -> int:
+    return mod(multiply(a, b), p)
+
+
+def x_power_mod(k: int, p: int) -> int:
+    """
+    Computes x^k mod p by square-and-multiply, in O(log k) squarings
+    """
+    result = 1
+    for bit in bin(k)[2:]:
+        result = mod(square(result), p)
+        if bit == "1":
+            result = mod(result << 1, p)
+    return result
+
+
+def berlekamp_massey(bits: list[int]) -> int:
+    """
+    Minimal polynomial of a linearly recurrent bit sequence. For a bit taken from the state of a generator
+    whose characteristic polynomial is primitive, 2 * degree bits suffice to recover it
+    :return: the characteristic polynomial, in the orientation where P(T) = 0 for the state transition T
+    """
+    connection, previous = 1, 1
+    length, shift = 0, 1
+    # Bit i of window is s[n - i], so the discrepancy is the parity of connection & window
+    window = 0
+    for n, bit in enumerate(bits):
+        window = (window << 1) | bit
+        if (connection & window).bit_count() & 1 == 0:
+            shift += 1
+        elif 2 * length <= n:
+            connection, previous = connection ^ (previous << shift), connection
+            length, shift = n + 1 - length, 1
+        else:
+            connection ^= previous << shift
+            shift += 1
+    # Reverse the connection polynomial C(x) into x^L C(1/x)
+    return int(format(connection, f"0{length + 1}b")[::-1], 2)
@@ -3,9 +3,45 @@
 # https://github.com/rossilor95/lcg-python/blob/main/lcg.py
 #####################################
 
+from itertools import islice
 from typing import Iterator
+import numpy as np
+import parallel
 # from matplotlib import pyplot as plt
 
+# Number of consecutive states produced from a single block start in lcg_block
+BLOCK_SIZE = 1 << 16
+# Minimum samples per worker of the parallel generators (see parallel.slice_bounds)
+MIN_PARALLEL_CHUNK = 1 << 20
+# Largest modulus for which (a^j mod m) * x + (c_j mod m) cannot overflow uint64
+_MAX_VECTOR_MODULUS = 1 << 32
+
+def _is_power_of_two(m: int) -> bool:
+    return m > 0 and m & (m - 1) == 0
+
+
+def _reduce(values: np.ndarray, m: int) -> np.ndarray:
+    """
+    Reduces a uint64 array modulo m in place. Power-of-two moduli only need a bitmask, since uint64
+    arithmetic already wraps around modulo 2**64
+    """
+    if _is_power_of_two(m):
+        values &= np.uint64(m - 1)
+    else:
+        values %= np.uint64(m)
+    return values
+
+
+def _vectorizable(m: int, a: int, c: int, seed: int) -> bool:
+    """
+    Tells whether lcg_block can use uint64 arithmetic: products stay below 2**64 for m <= 2**32, and
+    wraparound is harmless for power-of-two moduli up to 2**64
+    """
+    if not (m <= _MAX_VECTOR_MODULUS or _is_power_of_two(m) and m <= 2**64):
+        return False
+    return 0 <= a < m and 0 <= c < m and 0 <= seed < m
+
+
 def linear_congruential_generator(m: int, a: int, c: int, seed: int) -> Iterator[int]:
     """
     This generator implements the Linear Congruential Generator algorithm
@@ -16,6 +52,12 @@ def linear_congruential_generator(m: int, a: int, c: int, seed: int) -> Iterator
     :return: a non-negative integer in [0, m-1] representing the i-th state of the generator
     """
     x = seed
+    if _is_power_of_two(m):
+        # x % 2**k == x & (2**k - 1), also for negative x
+        mask = m - 1
+        while True:
+            yield x
+            x = (a * x + c) & mask
     while True:
         yield x
         x = (a * x + c) % m
@@ -41,6 +83,191 @@ def rand_float_samples(n_samples: int, m: int, a: int, c: int, seed: int) -> lis
     return sequence
 
 
+def lcg_jump(m: int, a: int, c: int, k: int) -> tuple[int, int]:
+    """
+    Computes the coefficients of k steps of the LCG by exponentiation by squaring of the affine map x -> (a*x + c) % m
+    :param k: the number of steps to jump, a non-negative integer
+    :return: the pair (A, C) such that the state k steps after x is (A * x + C) % m, computed in O(log k)
+    """
+    if k < 0:
+        raise ValueError("k must be non-negative")
+    acc_a, acc_c = 1 % m, 0
+    step_a, step_c = a % m, c % m
+    while k:
+        if k & 1:
+            acc_a, acc_c = (step_a * acc_a) % m, (step_a * acc_c + step_c) % m
+        step_a, step_c = (step_a * step_a) % m, (step_a * step_c + step_c) % m
+        k >>= 1
+    return acc_a, acc_c
+
+
+def lcg_skip(m: int, a: int, c: int, seed: int, k: int) -> int:
+    """
+    Random access into the LCG sequence
+    :param k: the index of the requested state
+    :return: the k-th state yielded by linear_congruential_generator(m, a, c, seed)
+    """
+    if k == 0:
+        return seed
+    jump_a, jump_c = lcg_jump(m, a, c, k)
+    return (jump_a * seed + jump_c) % m
+
+
+def _affine_powers(m: int, a: int, c: int, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Precomputes the coefficients of the first `size` powers of the LCG step x -> (a*x + c) % m
+    The j-th state after x is (mult[j] * x + incr[j]) % m, with mult[j] = a^j % m and
+    incr[j] = c * (a^(j-1) + ... + a + 1) % m. Both tables are built by doubling, using
+    f^(j+h)(x) = A_j * (A_h * x + C_h) + C_j
+    :param size: the number of coefficients to compute, a power of two
+    :return: the uint64 arrays (mult, incr)
+    """
+    mult = np.empty(size, dtype=np.uint64)
+    incr = np.empty(size, dtype=np.uint64)
+    mult[0], incr[0] = 1 % m, 0
+    h = 1
+    while h < size:
+        a_h, c_h = np.uint64((a * int(mult[h - 1])) % m), np.uint64((a * int(incr[h - 1]) + c) % m)
+        mult[h:2 * h] = _reduce(mult[:h] * a_h, m)
+        incr[h:2 * h] = _reduce(mult[:h] * c_h + incr[:h], m)
+        h *= 2
+    return mult, incr
+
+
+def lcg_block(m: int, a: int, c: int, seed: int, n: int) -> np.ndarray:
+    """
+    Computes the first n states of linear_congruential_generator(m, a, c, seed) as a NumPy array
+    For m <= 2**32 and for power-of-two moduli up to 2**64 the states are evaluated BLOCK_SIZE at a time
+    with vectorized affine recurrences; other moduli fall back to iterating the scalar generator
+    :param n: the number of states to generate
+    :return: a uint64 array (object array if the states do not fit in 64 bits) equal to the generator output
+    """
+    if _vectorizable(m, a, c, seed):
+        states = np.empty(n, dtype=np.uint64)
+        size = min(BLOCK_SIZE, 1 << max(n - 1, 0).bit_length())
+        mult, incr = _affine_powers(m, a, c, size)
+        # Coefficients of the jump from one block start to the next
+        a_block = (a * int(mult[-1])) % m
+        c_block = (a * int(incr[-1]) + c) % m
+        x = seed
+        for start in range(0, n, size):
+            block = states[start:start + size]
+            length = len(block)
+            np.multiply(mult[:length], np.uint64(x), out=block)
+            block += incr[:length]
+            _reduce(block, m)
+            x = (a_block * x + c_block) % m
+        return states
+
+    gen = islice(linear_congruential_generator(m, a, c, seed), n)
+    if 0 <= seed < 2**64 and m <= 2**64:
+        return np.fromiter(gen, dtype=np.uint64, count=n)
+    return np.array(list(gen), dtype=object)
+
+
+def rand_float_block(n_samples: int, m: int, a: int, c: int, seed: int) -> np.ndarray:
+    """
+    Vectorized counterpart of rand_float_samples, bit-identical to its output
+    :param n_samples: the number of pseudo-random floats to generate
+    :param seed: the starting state of the LCG. It is used to initialize the pseudo-random number sequence
+    :return: a float64 array of length n_samples containing the generated pseudo-random numbers
+    """
+    states = lcg_block(m, a, c, seed, n_samples)
+    if states.dtype == np.uint64 and (m <= 2**53 or _is_power_of_two(m)):
+        # Either states and modulus are exact in float64, or the division only scales the correctly
+        # rounded state by a power of two, so the result is correctly rounded like int / int
+        return states.astype(np.float64) / float(m)
+    return np.fromiter((int(x) / m for x in states), dtype=np.float64, count=n_samples)
+
+
+def _float_slice(start: int, stop: int, m: int, a: int, c: int, seed: int) -> np.ndarray:
+    return rand_float_block(stop - start, m, a, c, lcg_skip(m, a, c, seed, start))
+
+
+def _state_slice(start: int, stop: int, m: int, a: int, c: int, seed: int) -> np.ndarray:
+    return lcg_block(m, a, c, lcg_skip(m, a, c, seed, start), stop - start)
+
+
+def _parallel(fill, dtype, n_samples: int, m: int, a: int, c: int, seed: int, workers: int) -> np.ndarray:
+    """
+    Runs fill over `workers` disjoint slices of the (m, a, c, seed) stream in a process pool. Each worker jumps
+    to its own offset and writes its slice of a shared memory array, so the result is identical to the serial
+    fill(0, n_samples, ...) regardless of the number of workers
+    """
+    bounds = parallel.slice_bounds(n_samples, workers, MIN_PARALLEL_CHUNK)
+    if len(bounds) <= 2:
+        return fill(0, n_samples, m, a, c, seed)
+    tasks = [(start, stop, fill, (start, stop, m, a, c, seed)) for start, stop in zip(bounds[:-1], bounds[1:])]
+    return parallel.fill_shared(n_samples, dtype, tasks)
+
+
+def rand_float_parallel(n_samples: int, m: int, a: int, c: int, seed: int, workers: int) -> np.ndarray:
+    """
+    Generates the output of rand_float_block across a process pool (see _parallel)
+    :param n_samples: the number of pseudo-random floats to generate
+    :param workers: the number of worker processes
+    :return: a float64 array of length n_samples containing the generated pseudo-random numbers
+    """
+    return _parallel(_float_slice, np.float64, n_samples, m, a, c, seed, workers)
+
+
+def lcg_block_parallel(m: int, a: int, c: int, seed: int, n: int, workers: int) -> np.ndarray:
+    """
+    Generates the output of lcg_block across a process pool (see _parallel). States that do not fit in
+    uint64 are generated serially
+    """
+    if not _vectorizable(m, a, c, seed):
+        return lcg_block(m, a, c, seed, n)
+    return _parallel(_state_slice, np.uint64, n, m, a, c, seed, workers)
+
+
+class LCG:
+    """
+    Stateful Linear Congruential Generator that can seek to any position of its sequence in O(log k). The seed
+    is reduced modulo m, so that every state, the first one included, is in [0, m); this leaves the rest of the
+    sequence unchanged
+    """
+
+    def __init__(self, m: int, a: int, c: int, seed: int):
+        seed %= m
+        self.m, self.a, self.c, self.seed = m, a, c, seed
+        self.position = 0
+        self.state = seed
+
+    def __iter__(self) -> "LCG":
+        return self
+
+    def __next__(self) -> int:
+        x = self.state
+        self.state = (self.a * x + self.c) % self.m
+        self.position += 1
+        return x
+
+    def seek(self, k: int) -> None:
+        """
+        Moves the generator so that the next state returned is the k-th state of the sequence
+        :param k: the absolute position in the sequence, a non-negative integer
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self.state = lcg_skip(self.m, self.a, self.c, self.seed, k)
+        self.position = k
+
+    def skip(self, k: int) -> None:
+        """
+        Discards the next k states
+        """
+        self.seek(self.position + k)
+
+    def block(self, n: int) -> np.ndarray:
+        """
+        Returns the next n states as a NumPy array (see lcg_block) and advances the generator past them
+        """
+        states = lcg_block(self.m, self.a, self.c, self.state, n)
+        self.skip(n)
+        return states
+
+
 # if __name__ == "__main__":
 #     n = 1000
 #     rand_sequence = rand_float_samples(n)
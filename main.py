@@ -1,34 +1,288 @@
 import argparse
-import py_random_source_code as py_random
-from typing import List
-import lcg
-import time
-import memory_profiler
-from matplotlib import pyplot as plt
-from scipy import stats
-import numpy as np
-
-def print_statistics(case_name, time_taken, memory_used, chi_stat, chi_p, auto_corr):
+import os
+
+DEFAULT_ENGINES = ("lcg", "mt")
+# Set in the processes of the test case scheduler (see _init_job_worker)
+_timing_lock = None
+
+def print_statistics(case_name, measurement, chi_stat, chi_p, auto_corr, cached=False):
+    """
+    :param measurement: the Measurement.to_dict() of the generation benchmark of the job, without times when the
+    generation was not timed
+    :param cached: whether the sequence was read from the cache, the reason it was not timed
+    """
+    rss = measurement["rss_high_water"]
     print(f"{case_name} Test Case:")
-    print(f"  Tempo percorrido: {time_taken:.6f}s")
-    print(f"  Memória utilizada: {memory_used:.6f} MiB")
+    if measurement["times"]:
+        percentiles = measurement["percentiles"]
+        print(f"  Tempo percorrido: {measurement['median']:.6f}s (mediana de {len(measurement['times'])} execuções, "
+              f"p10-p90: {percentiles['10']:.6f}-{percentiles['90']:.6f}s, {measurement['ns_per_sample']:.2f} ns/número)")
+    else:
+        print(f"  Tempo percorrido: não medido{', sequência lida do cache' if cached else ''}")
+    print(f"  Memória utilizada: {measurement['traced_peak'] / 2**20:.6f} MiB (pico do tracemalloc), "
+          f"RSS máximo: {f'{rss / 2**20:.1f} MiB' if rss is not None else 'indisponível'}")
     print(f"  Resultados estatísticos:")
     print(f"    Teste Qui-Quadrado: {chi_stat}")
     print(f"    P-Value: {chi_p}")
     print(f"    Coeficiente de autocorrelação: {auto_corr}\n")
 
-# Mersenne Twister Implementation
-class MersenneTwister:
-    def __init__(self, seed=None):
-        self.random_instance = py_random.Random(seed)
-    
-    def generate_sequence(self, n_samples: int) -> List[float]:
-        return [self.random_instance.random() for _ in range(n_samples)]
+def sequence_chunks(sequence_cache, params, n_samples, chunk_size, generate, start=0):
+    """
+    Streams a generated sequence from position `start`, going through the on-disk cache when one is configured.
+    Resumed streams (start > 0) read the rest of the cached sequence if there is one, and otherwise generate
+    the rest without caching it
+    """
+    if sequence_cache is None:
+        return generate()
+    if start == 0:
+        return sequence_cache.chunks(params, n_samples, chunk_size, generate)
+    if sequence_cache.contains(params, n_samples):
+        cached = sequence_cache.get(params)
+        return (cached[i:i + chunk_size] for i in range(start, n_samples, chunk_size))
+    return generate()
 
-def run_test_cases(lcg_multiplier, lcg_modulus, lcg_increment, seed, maxRange, count=None):
-    # Initialize the Mersenne Twister with a random seed
-    mt = MersenneTwister(seed)
-    
+def generate_integers(engine, n_samples, chunk_size, range_start, range_end):
+    """
+    Streams integers in [range_start, range_end], both ends included as in the bins of the statistics, generated
+    with Lemire's method from the raw words of the engine. Ranges wider than the words of the engine (small LCG
+    moduli) fall back to scaling the floats
+    """
+    import streaming
+
+    stop = range_end + 1
+    if stop - range_start <= engine.word_range:
+        return engine.integer_chunks(n_samples, chunk_size, range_start, stop)
+    return streaming.scale_chunks(engine.chunks(n_samples, chunk_size), range_start, stop)
+
+def _init_job_worker(lock, counter, cpus):
+    """
+    Initializer of the processes of the test case scheduler: shares the lock that serializes the timed
+    generation, and pins each process to its own CPU so that timed jobs do not migrate between cores
+    """
+    global _timing_lock
+    _timing_lock = lock
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    if cpus:
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+def run_stream(int_chunks, statistics, on_chunk=None):
+    """
+    Consumes a stream of integer chunks, feeding each chunk to the statistics accumulator, with only one chunk
+    alive at a time; on_chunk(chunk) is called after every chunk. Memory is measured over the stream
+    :return: the MemoryTracker of the stream
+    """
+    import benchmark
+
+    with benchmark.MemoryTracker() as tracker:
+        for chunk in int_chunks:
+            statistics.update(chunk)
+            if on_chunk is not None:
+                on_chunk(chunk)
+    return tracker
+
+def drain(chunks):
+    """
+    Consumes a stream of chunks without keeping them
+    """
+    for _ in chunks:
+        pass
+
+def run_battery(engine_names, seed, lcg_modulus, lcg_multiplier, lcg_increment, workers, n_samples, chunk_size):
+    """
+    Runs the test battery on the first n_samples doubles of each engine, streamed in chunks, and prints a
+    table with the p-value of every test and whether it passed
+    """
+    import battery
+    import engines
+
+    columns = []
+    for engine_name in engine_names:
+        engine = engines.create_engine(engine_name, seed, lcg_modulus, lcg_multiplier, lcg_increment, workers)
+        columns.append((engine.label, battery.run_battery(engine.chunks(n_samples, chunk_size))))
+
+    print(f"Bateria de testes estatísticos ({n_samples} números por gerador, falha se p < {battery.SUSPECT_P} ou p > {1 - battery.SUSPECT_P}):")
+    print(f"  {'Teste':<26}" + "".join(f"{label:>22}" for label, _ in columns))
+    for row, (test_name, _, _) in enumerate(columns[0][1]):
+        cells = []
+        for _, results in columns:
+            p_value = results[row][2]
+            cells.append(f"{p_value:>14.4g} {'ok' if battery.passed(p_value) else 'FALHA':>7}")
+        print(f"  {test_name:<26}" + "".join(cells))
+    print()
+
+def save_progress(checkpoint, run_params, reported_cases, jobs):
+    """
+    Checkpoints the run: the cases already reported and plotted, and the jobs of the others with their progress
+    and timings, the sums and histograms of their statistics and, for a job being streamed, the binary
+    snapshot of its engine
+    :param jobs: maps (case index, engine index) to (progress, statistics, snapshot or None)
+    """
+    import numpy as np
+
+    meta = {"params": run_params, "cases": sorted(reported_cases), "jobs": []}
+    arrays = {}
+    for index, ((case_index, engine_index), (progress, statistics, snapshot)) in enumerate(jobs.items()):
+        sums, arrays[f"counts_{index}"] = statistics.getstate()
+        if snapshot is not None:
+            arrays[f"snapshot_{index}"] = np.frombuffer(snapshot, dtype=np.uint8)
+        meta["jobs"].append({**progress, "case": case_index, "engine": engine_index, "sums": sums})
+    checkpoint.save(meta, arrays)
+
+def run_job(job, on_chunk=None):
+    """
+    Runs one (case, engine) job of run_test_cases: streams the integers of the engine through the statistics,
+    continuing from the checkpointed state of the job when there is one
+    :param job: the parameters of the job, built by run_test_cases
+    :param on_chunk: called with (engine, statistics, progress) after every chunk
+    :return: the progress (samples done, memory figures, cache use and the generation benchmark) and the statistics
+    """
+    from contextlib import nullcontext
+    from dataclasses import replace
+    import benchmark
+    import engines
+    import streaming
+
+    range_start, range_end = job["range"]
+    n_numbers = job["n_numbers"]
+    sequence_cache = job["sequence_cache"]
+    lcg_modulus, lcg_multiplier, lcg_increment = job["lcg"]
+    # Every case measures the first n_numbers of each engine, starting from the seed
+    engine = engines.create_engine(job["engine"], job["seed"], lcg_modulus, lcg_multiplier, lcg_increment, job["workers"])
+    statistics = streaming.StreamStatistics(range_end, (range_start, range_end))
+    params = {
+        "algorithm": engine.name, **engine.params(), "seed": job["seed"], "n": n_numbers,
+        "range": [range_start, range_end],
+    }
+    cached = sequence_cache is not None and sequence_cache.contains(params, n_numbers)
+    progress = {"done": 0, "cached": cached, "traced_peak": 0, "rss_high_water": None, "rss_growth": None}
+
+    # Resuming from the checkpoint; a sequence that was read from a cache entry evicted since is restarted
+    if job["saved"] is not None:
+        entry, counts, snapshot = job["saved"]
+        if entry["done"] == n_numbers or cached or not entry["cached"]:
+            # Whether the sequence is cached is taken from the cache as it is now, not as it was when checkpointed
+            progress = {**{key: entry[key] for key in progress}, "cached": cached}
+            if "measurement" in entry:
+                progress["measurement"] = entry["measurement"]
+            statistics.setstate((entry["sums"], counts))
+            if snapshot is not None:
+                engine.restore(snapshot.tobytes())
+
+    # Generating unbiased integers from the raw words and accumulating statistics, one chunk at a time
+    done = progress["done"]
+    if done < n_numbers:
+        int_chunks = sequence_chunks(
+            sequence_cache, params, n_numbers, job["chunk_size"],
+            lambda: generate_integers(engine, n_numbers - done, job["chunk_size"], range_start, range_end), done,
+        )
+
+        def on_stream_chunk(chunk):
+            progress["done"] += len(chunk)
+            if on_chunk is not None:
+                on_chunk(engine, statistics, progress)
+
+        tracker = run_stream(int_chunks, statistics, on_stream_chunk)
+        progress["traced_peak"] = max(progress["traced_peak"], tracker.traced_peak)
+        progress["rss_high_water"], progress["rss_growth"] = tracker.rss_high_water, tracker.rss_growth
+
+    # Benchmark of the generation alone, from fresh engines, after the streaming pass: tracemalloc is off and
+    # every timed run is measured the same way. It is skipped for a sequence read from the cache, which this run
+    # does not generate, and with repeat 0. Under the scheduler, the benchmarks of concurrent jobs are
+    # serialized so that each one runs alone
+    if "measurement" not in progress:
+        memory = {key: progress[key] for key in ("traced_peak", "rss_high_water", "rss_growth")}
+        if progress["cached"] or job["repeat"] == 0:
+            progress["measurement"] = {"times": [], "samples": n_numbers, **memory}
+        else:
+            with _timing_lock or nullcontext():
+                measurement = benchmark.measure(
+                    lambda fresh: drain(generate_integers(fresh, n_numbers, job["chunk_size"], range_start, range_end)),
+                    samples=n_numbers, warmup=job["warmup"], repeat=job["repeat"], memory=False,
+                    setup=lambda: engines.create_engine(job["engine"], job["seed"], lcg_modulus, lcg_multiplier, lcg_increment, job["workers"]),
+                )
+            progress["measurement"] = replace(measurement, **memory).to_dict()
+    return progress, statistics
+
+def plot_case(seed, case, panels):
+    """
+    Draws the histograms precomputed by the statistics stage for a test case side by side and saves them to
+    plots/. The counts are drawn as one filled step polygon per engine, instead of a patch of one vertex per
+    bin edge, on a standalone figure with the Agg canvas: it is never registered with pyplot and is released
+    explicitly once saved, so figures do not accumulate across cases
+    :param panels: a (title, counts, edges) tuple per engine
+    """
+    import gc
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(6 * len(panels), 6))
+    FigureCanvasAgg(figure)
+    try:
+        for index, (title, counts, edges) in enumerate(panels):
+            axes = figure.add_subplot(1, len(panels), index + 1)
+            axes.fill_between(edges, np.append(counts, counts[-1]), step="post", alpha=0.7, linewidth=0, label=title)
+            axes.set_ylim(bottom=0)
+            axes.set_title('Distribuição do ' + title)
+            axes.set_xlabel('Intervalo - Números gerados por barra: ' + str(int(case["n_numbers"]/case["range"][1])))
+            axes.set_ylabel('Frequência')
+
+        figure.tight_layout()
+        os.makedirs("plots", exist_ok=True)
+        figure.savefig(f"plots/{seed}_{case['n_numbers']}.png")
+    finally:
+        # The figure, its canvas and its artists reference each other, so they are only reclaimed by the cycle
+        # collector, which otherwise lets the rendered buffers of several cases pile up
+        figure.clear()
+        del figure
+        gc.collect()
+
+def available_cpus():
+    """
+    :return: the CPUs this process may run on
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+def start_scheduler(jobs, workers):
+    """
+    Process pool of the test case scheduler. Generation is timed under a shared lock, and when the engines
+    generate in a single process each scheduler process is pinned to its own CPU
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    cpus = available_cpus() if hasattr(os, "sched_setaffinity") and workers == 1 else []
+    return ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_job_worker,
+        initargs=(multiprocessing.Lock(), multiprocessing.Value("i", 0), cpus),
+    )
+
+def run_test_cases(lcg_multiplier, lcg_modulus, lcg_increment, seed, maxRange, count=None, workers=1, chunk_size=None, sequence_cache=None, engine_names=DEFAULT_ENGINES, checkpoint=None, resume=False, jobs=1, warmup=None, repeat=None, plot=True):
+    """
+    Runs every (case, engine) job and reports them in order. With jobs > 1 the jobs and the plots run on a
+    process pool (see start_scheduler) and are gathered into the same ordered report as a sequential run
+    :param chunk_size: defaults to streaming.DEFAULT_CHUNK_SIZE
+    :param warmup, repeat: the warm-up and timed runs of the generation benchmark of each job (see run_job),
+    default to benchmark.DEFAULT_WARMUP and benchmark.DEFAULT_REPEAT
+    :return: a JSON serializable record per reported job, with its statistics and benchmark
+    """
+    import benchmark
+    import engines
+    import streaming
+
+    chunk_size = streaming.DEFAULT_CHUNK_SIZE if chunk_size is None else chunk_size
+    warmup = benchmark.DEFAULT_WARMUP if warmup is None else warmup
+    repeat = benchmark.DEFAULT_REPEAT if repeat is None else repeat
+    # With more scheduler processes than CPUs, a timed generation would share its core with the statistics and
+    # plots of other jobs, which skews the benchmark
+    cpu_count = len(available_cpus())
+    if jobs > cpu_count:
+        print(f"Aviso: jobs limitado a {cpu_count}, o número de CPUs disponíveis, para não compartilhar núcleos com a geração cronometrada\n")
+        jobs = cpu_count
     test_cases = [
         {"n_numbers": 100,     "range": (1, 10)},     # Expected 10 numbers per bar
         {"n_numbers": 1000,    "range": (1, 100)},    # Expected 10 numbers per bar
@@ -40,85 +294,116 @@ def run_test_cases(lcg_multiplier, lcg_modulus, lcg_increment, seed, maxRange, c
     if count is not None:
         test_cases = [{"n_numbers": count, "range": (1, maxRange)}]
 
-    for case in test_cases:
-        #   Defining variables for the test case
-        range_start, range_end = case["range"]
-
-        # Memory and time measurement start for LCG
-        start_time_lcg = time.perf_counter()
-        mem_usage_start_lcg = memory_profiler.memory_usage()
-
-        # Generating LCG numbers
-        lcg_raw_floats = lcg.rand_float_samples(case["n_numbers"], lcg_modulus, lcg_multiplier, lcg_increment, seed)
-        lcg_numbers = []
-        for num in lcg_raw_floats:
-            # Scaling and shifting the number
-            scaled_num = int(num * (range_end - range_start)) + range_start
-            lcg_numbers.append(scaled_num)
-        
-        # Memory and time measurement end for LCG
-        mem_usage_end_lcg = memory_profiler.memory_usage()
-        end_time_lcg = time.perf_counter()
-        
-        # Memory and time measurement start for MT
-        start_time_mt = time.perf_counter()
-        mem_usage_start_mt = memory_profiler.memory_usage()
-        
-        # Generating MT numbers
-        mt_raw_floats = mt.generate_sequence(case["n_numbers"])
-        mt_numbers = []
-        for num in mt_raw_floats:
-            # Scaling and shifting the number
-            scaled_num = int(num * (range_end - range_start)) + range_start
-            mt_numbers.append(scaled_num)
-        
-        # Memory and time measurement end for MT
-        mem_usage_end_mt = memory_profiler.memory_usage()
-        end_time_mt = time.perf_counter()
-        
-        # Calculate performance metrics
-        time_taken_lcg = end_time_lcg - start_time_lcg
-        mem_used_lcg = max(mem_usage_end_lcg) - min(mem_usage_start_lcg)
-        
-        time_taken_mt = end_time_mt - start_time_mt
-        mem_used_mt = max(mem_usage_end_mt) - min(mem_usage_start_mt)
-
-        # Chi-squared test for uniformity for LCG
-        observed_frequencies, _ = np.histogram(lcg_numbers, bins=case["range"][1], range=case["range"])
-        expected_frequencies = np.full_like(observed_frequencies, len(lcg_numbers)/case["range"][1])
-        chi_square_statistic_lcg, p_value_lcg = stats.chisquare(observed_frequencies, expected_frequencies)
-        autocorr_coefficient_lcg = np.corrcoef(lcg_numbers[:-1], lcg_numbers[1:])[0, 1]
-
-        # Chi-squared test for uniformity for MT
-        observed_frequencies, _ = np.histogram(mt_numbers, bins=case["range"][1], range=case["range"])
-        expected_frequencies = np.full_like(observed_frequencies, len(mt_numbers)/case["range"][1])
-        chi_square_statistic_mt, p_value_mt = stats.chisquare(observed_frequencies, expected_frequencies)
-        autocorr_coefficient_mt = np.corrcoef(mt_numbers[:-1], mt_numbers[1:])[0, 1]
-
-        # Print results
-        print_statistics('LCG', time_taken_lcg, mem_used_lcg, chi_square_statistic_lcg, p_value_lcg, autocorr_coefficient_lcg)
-        print_statistics('MT', time_taken_mt, mem_used_mt, chi_square_statistic_mt, p_value_mt, autocorr_coefficient_mt)
-        print('-' * 50)
-
-        # Plotting the results for visual comparison
-        plt.figure(figsize=(12, 6))
-
-        bins = case["range"][1] if case["range"][1] > 100 else 100
-
-        plt.subplot(1, 2, 1)
-        plt.hist(lcg_numbers, bins=bins-1, alpha=0.7, label='LCG')
-        plt.title('Distribuição do LCG')
-        plt.xlabel('Intervalo - Números gerados por barra: ' + str(int(case["n_numbers"]/case["range"][1])))
-        plt.ylabel('Frequência')
-
-        plt.subplot(1, 2, 2)
-        plt.hist(mt_numbers, bins=bins-1, alpha=0.7, label='Mersenne Twister')
-        plt.title('Distribuição do Mersenne Twister')
-        plt.xlabel('Intervalo - Números gerados por barra: ' + str(int(case["n_numbers"]/case["range"][1])))
-        plt.ylabel('Frequência')
-
-        plt.tight_layout()
-        plt.savefig(f"plots/{seed}_{case['n_numbers']}.png")
+    # A checkpoint can only be resumed by a run that would produce the same sequences
+    run_params = {
+        "lcg": [lcg_modulus, lcg_multiplier, lcg_increment], "seed": seed, "count": count, "max_range": maxRange,
+        "engines": list(engine_names),
+    }
+    reported_cases, saved_jobs = set(), {}
+    saved = checkpoint.load() if checkpoint is not None and resume else None
+    if saved is not None:
+        meta, arrays = saved
+        if meta["params"] != run_params:
+            raise ValueError("O checkpoint foi gerado com outros parâmetros")
+        reported_cases = set(meta["cases"])
+        for index, entry in enumerate(meta["jobs"]):
+            saved_jobs[entry["case"], entry["engine"]] = (entry, arrays[f"counts_{index}"], arrays.get(f"snapshot_{index}"))
+        print(f"Retomando a execução: {len(reported_cases)} casos de teste concluídos\n")
+
+    job_params = {
+        (case_index, engine_index): {
+            "engine": engine_name, "seed": seed, "lcg": (lcg_modulus, lcg_multiplier, lcg_increment), "workers": workers,
+            "n_numbers": case["n_numbers"], "range": case["range"], "chunk_size": chunk_size,
+            "sequence_cache": sequence_cache, "saved": saved_jobs.get((case_index, engine_index)),
+            "warmup": warmup, "repeat": repeat,
+        }
+        for case_index, case in enumerate(test_cases) if case_index not in reported_cases
+        for engine_index, engine_name in enumerate(engine_names)
+    }
+    # Jobs finished but not yet reported and plotted, as saved in the checkpoints
+    finished = {}
+    report = []
+    scheduler = start_scheduler(jobs, workers) if jobs > 1 else None
+    futures = {key: scheduler.submit(run_job, job) for key, job in job_params.items()} if scheduler else {}
+    plots = {}
+
+    def mark_reported(case_index):
+        reported_cases.add(case_index)
+        for engine_index in range(len(engine_names)):
+            del finished[case_index, engine_index]
+
+    def collect():
+        """
+        Records the jobs and plots finished on the pool since the last call
+        """
+        for key, future in list(futures.items()):
+            if future.done():
+                finished[key] = (*future.result(), None)
+                del futures[key]
+        for case_index, future in list(plots.items()):
+            if future.done():
+                future.result()
+                mark_reported(case_index)
+                del plots[case_index]
+
+    try:
+        for case_index, case in enumerate(test_cases):
+            if case_index in reported_cases:
+                continue
+            panels = []
+            for engine_index, engine_name in enumerate(engine_names):
+                key = (case_index, engine_index)
+                if scheduler is None:
+                    def on_chunk(engine, statistics, progress):
+                        if checkpoint is not None and checkpoint.due():
+                            save_progress(checkpoint, run_params, reported_cases, {**finished, key: (progress, statistics, engine.snapshot())})
+
+                    finished[key] = (*run_job(job_params[key], on_chunk), None)
+                else:
+                    if key not in finished:
+                        futures[key].result()
+                    collect()
+                    if checkpoint is not None and checkpoint.due():
+                        save_progress(checkpoint, run_params, reported_cases, finished)
+                progress, statistics, _ = finished[key]
+
+                # Chi-squared test for uniformity and lag-1 autocorrelation
+                chi_square_statistic, p_value = statistics.chi_square()
+                autocorr_coefficient = statistics.autocorrelation()
+
+                # Print results
+                label, title = engines.ENGINES[engine_name].label, engines.ENGINES[engine_name].title
+                print_statistics(label, progress["measurement"], chi_square_statistic, p_value, autocorr_coefficient, progress["cached"])
+                report.append({
+                    "n_numbers": case["n_numbers"], "range": list(case["range"]), "engine": engine_name,
+                    "chi_square": float(chi_square_statistic), "p_value": float(p_value),
+                    "autocorrelation": float(autocorr_coefficient), "benchmark": progress["measurement"],
+                })
+                panels.append((title, statistics.counts, statistics.edges))
+            print('-' * 50, flush=True)
+
+            # Plotting the histograms accumulated by the statistics stage for visual comparison, on the pool
+            # under the scheduler so that the plots of different cases render concurrently
+            if not plot:
+                mark_reported(case_index)
+            elif scheduler is None:
+                plot_case(seed, case, panels)
+                mark_reported(case_index)
+            else:
+                plots[case_index] = scheduler.submit(plot_case, seed, case, panels)
+            if checkpoint is not None:
+                save_progress(checkpoint, run_params, reported_cases, finished)
+
+        for future in plots.values():
+            future.result()
+    finally:
+        if scheduler is not None:
+            scheduler.shutdown(cancel_futures=True)
+
+    # The run is complete, there is nothing left to resume
+    if checkpoint is not None:
+        checkpoint.remove()
+    return report
 
 
 def main():
@@ -142,11 +427,96 @@ def main():
     parser.add_argument(
         "--max_range", type=int, default=1000000, help="Abrangência dos números aleatórios gerados"
     )
+    parser.add_argument(
+        "--chunk_size", "--chunk-size", type=int,
+        help="Quantidade de números mantidos em memória por vez durante a geração e os testes"
+    )
+    parser.add_argument(
+        "--cache_dir", type=str, required=False,
+        help="Diretório do cache em disco das sequências geradas, padrão: cache desabilitado"
+    )
+    parser.add_argument(
+        "--cache_size", type=int, help="Tamanho máximo do cache em MiB"
+    )
+    parser.add_argument(
+        "--engines", nargs="+", default=list(DEFAULT_ENGINES),
+        help="Geradores comparados nos casos de teste, entre lcg, mt, pcg64, xoshiro256** e splitmix64, padrão: lcg mt"
+    )
+    parser.add_argument(
+        "--spectral", action="store_true", help="Executa o teste espectral do multiplicador do LCG nas dimensões 2 a 8"
+    )
+    parser.add_argument(
+        "--battery", action="store_true",
+        help="Executa a bateria de testes estatísticos (Kolmogorov-Smirnov, corridas, gap, poker, colecionador de cupons, serial e espaçamento de aniversários) em cada gerador"
+    )
+    parser.add_argument(
+        "--no-plots", "--no_plots", dest="plots", action="store_false",
+        help="Não gera os gráficos dos histogramas em plots/"
+    )
+    parser.add_argument(
+        "--warmup", type=int,
+        help="Execuções de aquecimento, não cronometradas, antes de medir a geração de cada gerador"
+    )
+    parser.add_argument(
+        "--repeat", type=int,
+        help="Execuções cronometradas da geração de cada gerador; são exibidos a mediana e os percentis 10 e 90. Com 0 a geração não é cronometrada"
+    )
+    parser.add_argument(
+        "--json", type=str, required=False,
+        help="Arquivo JSON onde são salvos os resultados estatísticos e os benchmarks de cada caso de teste"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Número de processos que executam os pares (caso de teste, gerador) e os gráficos em paralelo; a geração cronometrada é serializada entre eles"
+    )
+    parser.add_argument(
+        "--checkpoint", type=str, required=False,
+        help="Arquivo de checkpoint salvo periodicamente durante a execução, padrão: checkpoint desabilitado"
+    )
+    parser.add_argument(
+        "--checkpoint_interval", type=float,
+        help="Intervalo em segundos entre checkpoints"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Retoma a execução a partir do checkpoint"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Número de processos usados para gerar as sequências do LCG e do Mersenne Twister"
+    )
 
     args = parser.parse_args()
 
+    # Loaded after parsing, so that --help does not pay for NumPy and the generators; the defaults that come
+    # from these modules are resolved here as well
+    import benchmark
+    import engines
+    import period
+    import py_random_source_code as py_random
+    import streaming
+    from cache import DEFAULT_CACHE_SIZE_MIB, SequenceCache
+    from checkpoint import Checkpoint, DEFAULT_INTERVAL_SECONDS
+
+    unknown = [name for name in args.engines if name not in engines.ENGINES]
+    if unknown:
+        parser.error(f"geradores desconhecidos: {', '.join(unknown)} (opções: {', '.join(engines.ENGINES)})")
+    for name, default in (("chunk_size", streaming.DEFAULT_CHUNK_SIZE), ("cache_size", DEFAULT_CACHE_SIZE_MIB),
+                          ("warmup", benchmark.DEFAULT_WARMUP), ("repeat", benchmark.DEFAULT_REPEAT),
+                          ("checkpoint_interval", DEFAULT_INTERVAL_SECONDS)):
+        if getattr(args, name) is None:
+            setattr(args, name, default)
+
     if args.lcg_multiplier >= args.lcg_modulus or args.lcg_increment >= args.lcg_modulus:
         raise ValueError("lcg_multiplier e lcg_increment devem ser menores que lcg_modulus")
+    if args.workers < 1:
+        raise ValueError("workers deve ser maior ou igual a 1")
+    if args.chunk_size < 1:
+        raise ValueError("chunk_size deve ser maior ou igual a 1")
+    if args.warmup < 0 or args.repeat < 0:
+        raise ValueError("warmup e repeat devem ser maiores ou iguais a 0")
+    if args.jobs < 1:
+        raise ValueError("jobs deve ser maior ou igual a 1")
+    if args.resume and not args.checkpoint:
+        raise ValueError("resume requer checkpoint")
 
     # Access the LCG parameters from the args namespace
     lcg_multiplier = args.lcg_multiplier
@@ -155,6 +525,10 @@ def main():
     seed = args.seed or py_random.Random().randint(0, 2**32 - 1)
     count = args.count
     maxRange = args.max_range
+    workers = args.workers
+    chunk_size = args.chunk_size
+    sequence_cache = SequenceCache(args.cache_dir, args.cache_size * 2**20) if args.cache_dir else None
+    checkpoint = Checkpoint(args.checkpoint, args.checkpoint_interval) if args.checkpoint else None
 
     # log
     print(f"LCG Multiplier: {lcg_multiplier}")
@@ -165,7 +539,33 @@ def main():
         print(f"Count: {count}")
         print(f"Range: 1 - {maxRange}")
 
-    run_test_cases(lcg_multiplier, lcg_modulus, lcg_increment, seed, maxRange, count)
+    report = period.analyze(lcg_modulus, lcg_multiplier, lcg_increment, seed)
+    print(f"LCG Period: {report.period} (máximo: {report.max_period}, transiente: {report.tail})")
+    for violation in report.violations:
+        print(f"Aviso: período completo não garantido (Hull-Dobell): {violation}")
+    largest_count = count if count is not None else 1_000_000
+    if largest_count > report.tail + report.period:
+        print(f"Aviso: a sequência do LCG se repete após {report.tail + report.period} números")
+    print()
+
+    if args.spectral:
+        import spectral
+
+        print("Teste espectral do LCG:")
+        print(f"  {'t':>2} {'nu^2':>22} {'mu':>10} {'S_t':>8}")
+        for figures in spectral.spectral_test(lcg_modulus, lcg_multiplier):
+            print(f"  {figures.dimension:>2} {figures.nu_squared:>22} {figures.mu:>10.4f} {figures.normalized:>8.4f}")
+        print()
+
+    if args.battery:
+        run_battery(args.engines, seed, lcg_modulus, lcg_multiplier, lcg_increment, workers, largest_count, chunk_size)
+
+    report = run_test_cases(lcg_multiplier, lcg_modulus, lcg_increment, seed, maxRange, count, workers, chunk_size, sequence_cache, args.engines, checkpoint, args.resume, args.jobs, args.warmup, args.repeat, args.plots)
+    if args.json:
+        import json
+
+        with open(args.json, "w") as f:
+            json.dump({"seed": seed, "cases": report}, f, indent=2)
     
 if __name__ == "__main__":
     main()
\ No newline at end of file
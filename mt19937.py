@@ -0,0 +1,289 @@
+from functools import lru_cache
+import numpy as np
+import gf2
+import parallel
+import py_random_source_code as py_random
+
+# MT19937 parameters (Matsumoto and Nishimura)
+N = 624
+M = 397
+MATRIX_A = 0x9908B0DF
+UPPER_MASK = 0x80000000
+LOWER_MASK = 0x7FFFFFFF
+MASK32 = 0xFFFFFFFF
+# x[k + N] depends on x[k], x[k + 1] and x[k + M], so N - M words of the sequence can be computed at once
+_STEP = N - M
+# Degree of the characteristic polynomial, the number of meaningful state bits (N * 32 - 31)
+DEGREE = 19937
+# Minimum samples per worker of the parallel generators (see parallel.slice_bounds); higher than the
+# LCG's because every worker start costs a polynomial jump
+MIN_PARALLEL_CHUNK = 1 << 22
+
+def _init_genrand(s: int) -> list[int]:
+    mt = [0] * N
+    mt[0] = s & MASK32
+    for i in range(1, N):
+        mt[i] = (1812433253 * (mt[i - 1] ^ (mt[i - 1] >> 30)) + i) & MASK32
+    return mt
+
+
+def _init_by_array(key: list[int]) -> list[int]:
+    """
+    Seeding of CPython's _randommodule.c, so MT19937(seed) starts from the state of Random(seed)
+    """
+    mt = _init_genrand(19650218)
+    i, j = 1, 0
+    for _ in range(max(N, len(key))):
+        mt[i] = ((mt[i] ^ ((mt[i - 1] ^ (mt[i - 1] >> 30)) * 1664525)) + key[j] + j) & MASK32
+        i, j = i + 1, j + 1
+        if i >= N:
+            mt[0], i = mt[N - 1], 1
+        if j >= len(key):
+            j = 0
+    for _ in range(N - 1):
+        mt[i] = ((mt[i] ^ ((mt[i - 1] ^ (mt[i - 1] >> 30)) * 1566083941)) - i) & MASK32
+        i += 1
+        if i >= N:
+            mt[0], i = mt[N - 1], 1
+    mt[0] = 0x80000000
+    return mt
+
+
+def temper(y: np.ndarray) -> np.ndarray:
+    """
+    MT19937 output tempering over a whole uint32 array
+    """
+    y = y ^ (y >> np.uint32(11))
+    y ^= (y << np.uint32(7)) & np.uint32(0x9D2C5680)
+    y ^= (y << np.uint32(15)) & np.uint32(0xEFC60000)
+    y ^= y >> np.uint32(18)
+    return y
+
+
+def words_to_doubles(words: np.ndarray) -> np.ndarray:
+    """
+    Builds doubles in [0, 1) from pairs of 32-bit outputs exactly like random(): (a >> 5, b >> 6) gives 53 bits
+    """
+    a = (words[0::2] >> np.uint32(5)).astype(np.float64)
+    b = (words[1::2] >> np.uint32(6)).astype(np.float64)
+    return (a * 67108864.0 + b) * (1.0 / 9007199254740992.0)
+
+
+class MT19937:
+    """
+    NumPy implementation of the Mersenne Twister of py_random_source_code.Random. The state is regenerated
+    N - M = 227 words at a time over a buffer holding several generations, and tempering and the 53-bit
+    double construction are applied to whole arrays. The output is bit-identical to Random(seed), and the
+    state can be exchanged with Random through getstate()/setstate(). The pending Gaussian of Random.gauss()
+    is not used by this generator, but it is carried through so that the exchange does not lose it
+    """
+
+    def __init__(self, seed=None):
+        self.mt = np.zeros(N, dtype=np.uint32)
+        self.index = N
+        self.gauss_next = None
+        self.seed(seed)
+
+    def seed(self, seed=None) -> None:
+        """
+        Seeds like Random.seed(seed). Integers are seeded natively; other seed types go through Random
+        """
+        if isinstance(seed, int) and not isinstance(seed, bool):
+            n = abs(seed)
+            key = [(n >> (32 * i)) & MASK32 for i in range(max(1, (n.bit_length() + 31) // 32))]
+            self.mt[:] = _init_by_array(key)
+            self.index = N
+            self.gauss_next = None
+        else:
+            self.setstate(py_random.Random(seed).getstate())
+
+    @classmethod
+    def from_random(cls, random_instance: py_random.Random) -> "MT19937":
+        """
+        :return: a generator continuing the stream of random_instance
+        """
+        generator = cls(0)
+        generator.setstate(random_instance.getstate())
+        return generator
+
+    def getstate(self) -> tuple:
+        """
+        :return: the state in the format of Random.getstate()
+        """
+        return py_random.Random.VERSION, tuple(int(w) for w in self.mt) + (self.index,), self.gauss_next
+
+    def setstate(self, state: tuple) -> None:
+        """
+        Restores a state in the format of Random.getstate() (version 2 or 3)
+        """
+        random_instance = py_random.Random(0)
+        random_instance.setstate(state)
+        _, internal_state, self.gauss_next = random_instance.getstate()
+        self.mt[:] = internal_state[:N]
+        self.index = internal_state[N]
+
+    def _next_generations(self, generations: int) -> np.ndarray:
+        """
+        :return: a buffer with the current state followed by the next `generations` regenerated states
+        """
+        length = N * generations
+        x = np.empty(N + length, dtype=np.uint32)
+        x[:N] = self.mt
+        upper, lower, one = np.uint32(UPPER_MASK), np.uint32(LOWER_MASK), np.uint32(1)
+        matrix_a = np.uint32(MATRIX_A)
+        for k in range(0, length, _STEP):
+            step = min(_STEP, length - k)
+            y = (x[k:k + step] & upper) | (x[k + 1:k + 1 + step] & lower)
+            x[k + N:k + N + step] = x[k + M:k + M + step] ^ (y >> one) ^ ((y & one) * matrix_a)
+        return x
+
+    def random_words(self, n: int) -> np.ndarray:
+        """
+        :return: a uint32 array with the next n outputs of genrand_uint32, as getrandbits(32) would return them
+        """
+        generations = -(-(self.index + n - N) // N) if self.index + n > N else 0
+        x = self._next_generations(generations)
+        words = temper(x[self.index:self.index + n])
+        self.mt[:] = x[N * generations:]
+        self.index = self.index + n - N * generations
+        return words
+
+    def random_array(self, n: int) -> np.ndarray:
+        """
+        :return: a float64 array equal to n calls of Random.random()
+        """
+        return words_to_doubles(self.random_words(2 * n))
+
+    def random(self) -> float:
+        return float(self.random_array(1)[0])
+
+    def jump_words(self, k: int) -> None:
+        """
+        Advances the generator past k 32-bit outputs in O(log k) polynomial operations plus one Horner
+        evaluation. The window that is jumped must consist of generated words, since the seeded mt[0] does
+        not follow the recurrence, so up to two generations are first consumed normally
+        """
+        if k < 2 * N:
+            self.random_words(k)
+            return
+        # Consume the rest of the current generation and a full one, leaving index == N
+        consumed = N - self.index + N
+        self.random_words(consumed)
+        k -= consumed
+        if k == 0:
+            return
+        # The new index is kept in [1, N] so that mt[0] of the jumped window is never output directly
+        index = (k - 1) % N + 1
+        self.mt[:] = _apply_polynomial(self.mt, jump_polynomial(N + k - index))
+        self.index = index
+
+    def jump(self, k: int) -> None:
+        """
+        Advances the generator past k calls of random(), each consuming two 32-bit outputs
+        """
+        self.jump_words(2 * k)
+
+
+@lru_cache(maxsize=None)
+def characteristic_polynomial() -> int:
+    """
+    Characteristic polynomial of the MT19937 transition (degree 19937), recovered with Berlekamp-Massey
+    from the lowest bit of 2 * DEGREE outputs
+    """
+    words = MT19937(5489).random_words(2 * DEGREE)
+    return gf2.berlekamp_massey((words & np.uint32(1)).tolist())
+
+
+@lru_cache(maxsize=None)
+def _power_of_two_jump(i: int) -> int:
+    """
+    x^(2^i) mod P, the jump polynomial for 2^i steps; each entry is the square of the previous one
+    """
+    if i == 0:
+        return 2
+    return gf2.mod(gf2.square(_power_of_two_jump(i - 1)), characteristic_polynomial())
+
+
+@lru_cache(maxsize=64)
+def jump_polynomial(k: int) -> int:
+    """
+    x^k mod P, built from the precomputed polynomials for the powers of two in k
+    """
+    result = 1
+    # Every power is requested in increasing order, so _power_of_two_jump never recurses more than once
+    for i in range(k.bit_length()):
+        power = _power_of_two_jump(i)
+        if (k >> i) & 1:
+            result = gf2.mulmod(result, power, characteristic_polynomial())
+    return result
+
+
+def _apply_polynomial(window: np.ndarray, poly: int) -> np.ndarray:
+    """
+    Evaluates poly(T) on a window of N generated words with Horner's rule, where T appends the next word
+    of the recurrence and drops the first one. The accumulator is a circular buffer starting at `head`
+    """
+    acc = np.zeros(N, dtype=np.uint32)
+    head = 0
+    for bit in bin(poly)[2:]:
+        y = (acc.item(head) & UPPER_MASK) | (acc.item(head + 1 if head + 1 < N else 0) & LOWER_MASK)
+        acc[head] = acc.item(head + M if head + M < N else head + M - N) ^ (y >> 1) ^ (MATRIX_A if y & 1 else 0)
+        head = head + 1 if head + 1 < N else 0
+        if bit == "1":
+            acc[head:] ^= window[:N - head]
+            acc[:head] ^= window[N - head:]
+    return np.roll(acc, -head)
+
+
+def _substream(state: tuple, n_samples: int, floats: bool) -> np.ndarray:
+    """
+    Task of _parallel_substreams: n_samples doubles of random(), or words of getrandbits(32), from a Random state
+    """
+    random_instance = py_random.Random(0)
+    random_instance.setstate(state)
+    return random_instance.random_array(n_samples) if floats else random_instance.getrandbits_array(n_samples, 32)
+
+
+def _parallel_substreams(state: tuple, n_samples: int, workers: int, dtype) -> tuple[np.ndarray, tuple]:
+    """
+    Generates n_samples outputs from a Random state across a process pool. Each worker starts from the state
+    jumped to its own offset, so the substreams do not overlap and the result is identical to the serial one
+    regardless of the number of workers
+    :param state: a state in the format of Random.getstate()
+    :param dtype: float64 for calls of random(), uint32 for calls of getrandbits(32)
+    :return: the array and the state after the last sample
+    """
+    generator = MT19937(0)
+    generator.setstate(state)
+    floats = np.dtype(dtype) == np.float64
+    bounds = parallel.slice_bounds(n_samples, workers, MIN_PARALLEL_CHUNK)
+    if len(bounds) <= 2:
+        if n_samples == 0:
+            return np.empty(0, dtype=dtype), generator.getstate()
+        samples = generator.random_array(n_samples) if floats else generator.random_words(n_samples)
+        return samples, generator.getstate()
+
+    tasks = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        tasks.append((start, stop, _substream, (generator.getstate(), stop - start, floats)))
+        if floats:
+            generator.jump(stop - start)
+        else:
+            generator.jump_words(stop - start)
+    return parallel.fill_shared(n_samples, dtype, tasks), generator.getstate()
+
+
+def random_array_parallel(state: tuple, n_samples: int, workers: int) -> tuple[np.ndarray, tuple]:
+    """
+    n_samples calls of random() from a Random state, generated across a process pool (see _parallel_substreams)
+    :return: the float64 array and the state after the last sample
+    """
+    return _parallel_substreams(state, n_samples, workers, np.float64)
+
+
+def random_words_parallel(state: tuple, n_words: int, workers: int) -> tuple[np.ndarray, tuple]:
+    """
+    n_words calls of getrandbits(32) from a Random state, generated across a process pool (see _parallel_substreams)
+    :return: the uint32 array and the state after the last word
+    """
+    return _parallel_substreams(state, n_words, workers, np.uint32)
@@ -0,0 +1,53 @@
+from typing import Callable
+import numpy as np
+
+def slice_bounds(n_samples: int, workers: int, min_chunk: int) -> list[int]:
+    """
+    Splits [0, n_samples) into at most `workers` contiguous slices of at least min_chunk samples. Below that
+    size the cost of starting the pool and copying the result outweighs the work saved, so fewer workers are
+    used, down to a single slice when the generation is better left serial
+    :return: the slice boundaries, starting at 0 and ending at n_samples
+    """
+    workers = max(1, min(workers, n_samples // min_chunk))
+    return [n_samples * i // workers for i in range(workers + 1)]
+
+
+def _fill_slice(shm_name: str, n_samples: int, dtype, start: int, stop: int, fill: Callable, args: tuple) -> None:
+    """
+    Worker of fill_shared: writes fill(*args), samples [start, stop) of the output, into the shared buffer
+    """
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((n_samples,), dtype=dtype, buffer=shm.buf)
+        out[start:stop] = fill(*args)
+        del out
+    finally:
+        shm.close()
+
+
+def fill_shared(n_samples: int, dtype, tasks: list[tuple[int, int, Callable, tuple]]) -> np.ndarray:
+    """
+    Runs one task per process and gathers the results in a shared memory array, so that the slices are not
+    pickled back to the parent. Each task (start, stop, fill, args) writes fill(*args), an array of
+    stop - start samples, at [start, stop); fill must be a module-level function
+    :return: a copy of the filled array
+    """
+    # The process pool is only imported here, it is slow to load and serial runs never need it
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(create=True, size=n_samples * np.dtype(dtype).itemsize)
+    try:
+        with ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+            futures = [
+                pool.submit(_fill_slice, shm.name, n_samples, dtype, start, stop, fill, args)
+                for start, stop, fill, args in tasks
+            ]
+            for future in futures:
+                future.result()
+        return np.ndarray((n_samples,), dtype=dtype, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
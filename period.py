@@ -0,0 +1,243 @@
+from dataclasses import dataclass, field
+from math import gcd, lcm, isqrt
+from typing import Optional
+import random
+import lcg
+
+# Moduli up to this size are analysed by direct cycle detection instead of number theory
+BRENT_MAX_MODULUS = 1 << 16
+# Miller-Rabin with these bases is deterministic for n < 3.3 * 10**24
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+
+def is_prime(n: int) -> bool:
+    """
+    Miller-Rabin primality test, deterministic for n < 3.3 * 10**24
+    """
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for base in _MILLER_RABIN_BASES:
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_brent(n: int) -> int:
+    """
+    Finds a non-trivial factor of the odd composite n with Brent's variant of Pollard's rho
+    """
+    rng = random.Random(n)
+    while True:
+        y, c, batch = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += batch
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % n
+                g = gcd(abs(x - saved), n)
+        if g != n:
+            return g
+
+
+def factorize(n: int) -> dict[int, int]:
+    """
+    :param n: a positive integer
+    :return: the prime factorization of n as a {prime: exponent} dict
+    """
+    factors: dict[int, int] = {}
+    for p in _SMALL_PRIMES:
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    pending = [n] if n > 1 else []
+    while pending:
+        n = pending.pop()
+        if is_prime(n):
+            factors[n] = factors.get(n, 0) + 1
+            continue
+        root = isqrt(n)
+        if root * root == n:
+            pending += [root, root]
+            continue
+        d = _pollard_brent(n)
+        pending += [d, n // d]
+    return factors
+
+
+def carmichael(factors: dict[int, int]) -> int:
+    """
+    :param factors: the factorization of m, as returned by factorize
+    :return: the Carmichael function lambda(m), the largest multiplicative order modulo m
+    """
+    result = 1
+    for p, e in factors.items():
+        if p == 2 and e >= 3:
+            result = lcm(result, 2 ** (e - 2))
+        else:
+            result = lcm(result, p ** (e - 1) * (p - 1))
+    return result
+
+
+def hull_dobell_violations(m: int, a: int, c: int) -> list[str]:
+    """
+    Checks the Hull-Dobell theorem: the LCG has full period m for every seed iff c and m are coprime,
+    a - 1 is divisible by every prime factor of m, and a - 1 is divisible by 4 if m is
+    :return: the list of violated conditions, empty when the parameters have full period
+    """
+    violations = []
+    if gcd(c, m) != 1:
+        violations.append("c e m não são primos entre si")
+    factors = factorize(m)
+    for p in factors:
+        if (a - 1) % p != 0:
+            violations.append(f"a - 1 não é divisível pelo fator primo {p} de m")
+    if m % 4 == 0 and (a - 1) % 4 != 0:
+        violations.append("m é divisível por 4, mas a - 1 não é")
+    return violations
+
+
+def brent_cycle(m: int, a: int, c: int, seed: int) -> tuple[int, int]:
+    """
+    Brent's cycle detection on the sequence of linear_congruential_generator(m, a, c, seed), in O(tail + period) steps
+    :return: the pair (tail, period): the number of states before the cycle and the cycle length
+    """
+    step = lambda x: (a * x + c) % m
+    power = period = 1
+    tortoise, hare = seed, step(seed)
+    while tortoise != hare:
+        if power == period:
+            tortoise, power, period = hare, power * 2, 0
+        hare = step(hare)
+        period += 1
+    tortoise = hare = seed
+    for _ in range(period):
+        hare = step(hare)
+    tail = 0
+    while tortoise != hare:
+        tortoise, hare, tail = step(tortoise), step(hare), tail + 1
+    return tail, period
+
+
+def _coprime_cycle(m: int, a: int, c: int, x: int, factors: dict[int, int], order_factors: dict[int, dict[int, int]]) -> int:
+    """
+    Cycle length of x under x -> (a*x + c) % m when a and m are coprime, so every state is on a cycle.
+    Since f^k(x) - x = (1 + a + ... + a^(k-1)) * ((a - 1) * x + c), the cycle length is the order of the
+    affine map g(y) = a*y + 1 acting on 0 modulo q = m / gcd((a - 1) * x + c, m). It divides lambda(q) * q,
+    which is reduced one prime factor at a time with O(log k) jumps
+    """
+    q = m // gcd(((a - 1) * x + c) % m, m)
+    if q == 1:
+        return 1
+    q_factors = {p: e for p, e in factors.items() if q % p == 0}
+    for p in q_factors:
+        q_factors[p] = 0
+        while q % p ** (q_factors[p] + 1) == 0:
+            q_factors[p] += 1
+    order = carmichael(q_factors) * q
+    primes = set(q_factors)
+    for p in q_factors:
+        primes |= set(order_factors[p])
+    for p in primes:
+        while order % p == 0 and lcg.lcg_jump(q, a, 1, order // p)[1] == 0:
+            order //= p
+    return order
+
+
+def cycle_length(m: int, a: int, c: int, seed: int) -> tuple[int, int]:
+    """
+    Exact (tail, period) of linear_congruential_generator(m, a, c, seed) without iterating the sequence.
+    The modulus is split by the CRT into the prime powers dividing a, where the map contracts to a fixed
+    point within a few steps, and the rest, where a is invertible and the period is found by order finding
+    :return: the pair (tail, period): the number of states before the cycle and the cycle length
+    """
+    if m <= BRENT_MAX_MODULUS:
+        return brent_cycle(m, a, c, seed)
+    if not 0 <= seed < m:
+        # The unreduced seed is yielded once and never comes back
+        tail, period = cycle_length(m, a, c, (a * seed + c) % m)
+        return tail + 1, period
+
+    factors = factorize(m)
+    contracting = 1
+    for p, e in factors.items():
+        if a % p == 0:
+            contracting *= p ** e
+    invertible = m // contracting
+
+    tail = 0
+    if contracting > 1:
+        fixed_point = c * pow(1 - a, -1, contracting) % contracting
+        x = seed % contracting
+        while x != fixed_point:
+            x, tail = (a * x + c) % contracting, tail + 1
+
+    period = 1
+    if invertible > 1:
+        inv_factors = {p: e for p, e in factors.items() if invertible % p == 0}
+        order_factors = {p: factorize(p - 1) for p in inv_factors}
+        period = _coprime_cycle(invertible, a % invertible, c % invertible, seed % invertible, inv_factors, order_factors)
+    return tail, period
+
+
+@dataclass
+class PeriodReport:
+    m: int
+    a: int
+    c: int
+    seed: int
+    tail: int
+    period: int
+    max_period: int
+    violations: list[str] = field(default_factory=list)
+
+    @property
+    def full_period(self) -> bool:
+        """
+        Whether the Hull-Dobell conditions hold, i.e. every seed has period m
+        """
+        return not self.violations
+
+    @property
+    def reaches_max_period(self) -> bool:
+        """
+        Whether the seed reaches the largest period possible for this kind of LCG: m for mixed
+        generators (c != 0) and lambda(m) for multiplicative ones (c == 0)
+        """
+        return self.period == self.max_period
+
+
+def analyze(m: int, a: int, c: int, seed: Optional[int] = None) -> PeriodReport:
+    """
+    Period analysis of the LCG parameters, used by main before a run starts
+    :param seed: the seed whose cycle is measured, by default 1
+    """
+    seed = 1 if seed is None else seed
+    tail, period = cycle_length(m, a, c, seed)
+    max_period = m if c % m else carmichael(factorize(m))
+    return PeriodReport(m, a, c, seed, tail, period, max_period, hull_dobell_violations(m, a, c))
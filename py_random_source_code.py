@@ -58,45 +58,69 @@ from math import lgamma as _lgamma, fabs as _fabs, log2 as _log2
 from os import urandom as _urandom
 from _collections_abc import Sequence as _Sequence
 from operator import index as _index
-from itertools import accumulate as _accumulate, repeat as _repeat
+from itertools import accumulate as _accumulate, repeat as _repeat, islice as _islice
 from bisect import bisect as _bisect
+from functools import lru_cache as _lru_cache
 import os as _os
 import _random
 
-try:
-    # hashlib is pretty heavy to load, try lean internal module first
-    from _sha2 import sha512 as _sha512
-except ImportError:
-    # fallback to official implementation
-    from hashlib import sha512 as _sha512
+def _sha512(data):
+    # Only seeding from str/bytes needs it, so it is imported on first
+    # use; hashlib is pretty heavy to load, try lean internal module first
+    try:
+        from _sha2 import sha512
+    except ImportError:
+        # fallback to official implementation
+        from hashlib import sha512
+    return sha512(data)
 
 __all__ = [
+    "AliasSampler",
     "Random",
     "SystemRandom",
+    "alias_choices",
+    "alias_sampler",
     "betavariate",
+    "betavariate_array",
     "binomialvariate",
     "choice",
     "choices",
     "expovariate",
+    "expovariate_array",
+    "exponential",
+    "exponential_array",
     "gammavariate",
+    "gammavariate_array",
     "gauss",
     "getrandbits",
+    "getrandbits_array",
     "getstate",
     "lognormvariate",
+    "lognormvariate_array",
+    "normal",
+    "normal_array",
     "normalvariate",
+    "normalvariate_array",
     "paretovariate",
+    "paretovariate_array",
     "randbytes",
     "randint",
     "random",
+    "random_array",
     "randrange",
+    "reservoir_sample",
     "sample",
+    "sample_array",
     "seed",
     "setstate",
     "shuffle",
+    "shuffle_array",
     "triangular",
     "uniform",
     "vonmisesvariate",
+    "vonmisesvariate_array",
     "weibullvariate",
+    "weibullvariate_array",
 ]
 
 NV_MAGICCONST = 4 * _exp(-0.5) / _sqrt(2.0)
@@ -105,6 +129,122 @@ SG_MAGICCONST = 1.0 + _log(4.5)
 BPF = 53        # Number of bits in a float
 RECIP_BPF = 2 ** -BPF
 _ONE = 1
+ALIAS_CACHE_SIZE = 32   # number of weight vectors whose alias tables are kept
+_ALIAS_VECTOR_MIN = 64  # below this k, alias_choices draws one at a time
+# Ziggurat (layers, R, V): the base layer starts at R and every layer has
+# area V (Marsaglia and Tsang, 2000)
+ZIGGURAT_NORMAL = (128, 3.442619855899, 9.91256303526217e-3)
+ZIGGURAT_EXPONENTIAL = (256, 7.697117470131487, 3.949659822581572e-3)
+
+
+## ----------------------- alias tables ------------------------------
+
+class AliasSampler:
+    """Walker's alias table for a fixed weight vector, built with Vose's
+    method in O(n).
+
+    Each of the n columns holds the probability of keeping its own index
+    and the index it otherwise aliases to, so a draw costs one uniform,
+    one multiplication and one comparison regardless of n.  The uniform
+    u * n picks the column with its integer part and is compared with
+    the fractional part.
+
+    """
+
+    __slots__ = ('n', 'probability', 'alias', '_arrays')
+
+    def __init__(self, weights):
+        n = len(weights)
+        if n == 0:
+            raise IndexError('Cannot build an alias table from empty weights')
+        total = sum(weights) + 0.0    # convert to float
+        if total <= 0.0:
+            raise ValueError('Total of weights must be greater than zero')
+        if not _isfinite(total):
+            raise ValueError('Total of weights must be finite')
+        if min(weights) < 0.0:
+            raise ValueError('Weights must be non-negative')
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        probability = [1.0] * n
+        alias = list(range(n))
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Columns left over in either list are full up to rounding error
+        self.n = n
+        self.probability = probability
+        self.alias = alias
+        self._arrays = None
+
+    def index(self, u):
+        """Map a uniform u in [0, 1) to an index drawn from the weights."""
+        x = u * self.n
+        i = int(x)
+        return i if x - i < self.probability[i] else self.alias[i]
+
+    def indices(self, u):
+        """Vectorized index() over a NumPy array of uniforms."""
+        import numpy as np
+
+        if self._arrays is None:
+            self._arrays = (np.array(self.probability), np.array(self.alias, dtype=np.intp))
+        probability, alias = self._arrays
+        x = u * self.n
+        i = x.astype(np.intp)
+        return np.where(x - i < probability[i], i, alias[i])
+
+
+@_lru_cache(maxsize=ALIAS_CACHE_SIZE)
+def _cached_alias_sampler(weights):
+    return AliasSampler(weights)
+
+
+def alias_sampler(weights):
+    """Return the AliasSampler for a weight sequence, shared through a
+    cache keyed by the weights (the last ALIAS_CACHE_SIZE vectors are
+    kept).  Looking it up costs O(n) to hash the weights, so callers
+    drawing repeatedly should keep the returned sampler and pass it to
+    alias_choices() instead of the weights."""
+    return _cached_alias_sampler(tuple(weights))
+
+
+## ----------------------- ziggurat tables ---------------------------
+
+def _ziggurat_tables(density, inverse, layers, r, v):
+    """Layer tables of a Ziggurat for a decreasing density with f(0) = 1.
+
+    x[i] is the right edge of layer i: x[0] = V / f(R) is the width of the
+    base layer stretched to cover the tail, x[1] = R and each following
+    layer of area V ends at x[i + 1] = f^-1(V / x[i] + f(x[i])), up to
+    x[layers] = 0.  Draws take a 53-bit integer j per layer, so the
+    tables are returned in integer form as (k, w, f): j lands under the
+    curve when j < k[i] = 2**53 * x[i + 1] / x[i], x = j * w[i] with
+    w[i] = x[i] * 2**-53, and f[i] = f(x[i]).
+
+    """
+    x = [v / density(r), r]
+    for i in range(2, layers):
+        x.append(inverse(min(v / x[-1] + density(x[-1]), 1.0)))
+    x.append(0.0)
+    k = tuple(int(x[i + 1] / x[i] * 2.0 ** BPF) for i in range(layers))
+    w = tuple(xi * RECIP_BPF for xi in x)
+    return k, w, tuple(density(xi) for xi in x)
+
+_NORMAL_TABLES = _ziggurat_tables(lambda x: _exp(-0.5 * x * x), lambda y: _sqrt(-2.0 * _log(y)), *ZIGGURAT_NORMAL)
+_EXPONENTIAL_TABLES = _ziggurat_tables(lambda x: _exp(-x), lambda y: -_log(y), *ZIGGURAT_EXPONENTIAL)
+
+@_lru_cache(maxsize=None)
+def _ziggurat_arrays(tables):
+    import numpy as np
+
+    k, w, f = tables
+    return np.array(k, dtype=np.uint64), np.array(w), np.array(f)
 
 
 class Random(_random.Random):
@@ -286,6 +426,99 @@ class Random(_random.Random):
         return self.getrandbits(n * 8).to_bytes(n, 'little')
 
 
+    ## -------------------- array methods ---------------------
+
+    def random_array(self, n, *, chunk=1<<15):
+        """Return a NumPy float64 array equal to n calls of random().
+
+        The Mersenne Twister words are pulled in bulk with getrandbits(),
+        which emits them least significant word first, and each pair of
+        words (a, b) becomes (a >> 5, b >> 6) scaled by 2**-53, the same
+        53-bit construction random() uses.  Words are converted in chunks
+        of *chunk* samples, which keeps the intermediate int and bytes
+        objects cache-sized.  Subclasses that override random() fall back
+        to calling it n times.
+
+        """
+        import numpy as np
+
+        n = _index(n)
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if type(self).random is not _random.Random.random:
+            random = self.random
+            return np.fromiter((random() for i in _repeat(None, n)), np.float64, n)
+        getrandbits = self.getrandbits
+        result = np.empty(n, dtype=np.float64)
+        for start in range(0, n, chunk):
+            size = min(chunk, n - start)
+            words = np.frombuffer(getrandbits(64 * size).to_bytes(8 * size, 'little'), dtype='<u4')
+            a = (words[0::2] >> 5).astype(np.float64)
+            b = (words[1::2] >> 6).astype(np.float64)
+            result[start:start + size] = (a * 67108864.0 + b) * (1.0 / 9007199254740992.0)
+        return result
+
+
+    def getrandbits_array(self, n, k, *, chunk=1<<15):
+        """Return a NumPy array equal to n calls of getrandbits(k), 0 < k <= 64.
+
+        A call takes the k high bits of one 32-bit word for k <= 32, and
+        two words for larger k, the first one as the low half, so the
+        words are pulled in chunks of *chunk* values with a single
+        getrandbits() call each, like random_array().  The dtype is
+        uint32 for k <= 32 and uint64 otherwise.
+
+        """
+        import numpy as np
+
+        n = _index(n)
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if not 0 < k <= 64:
+            raise ValueError("k must be in the range 1 to 64")
+        words_per_value = 1 if k <= 32 else 2
+        result = np.empty(n, dtype=np.uint32 if k <= 32 else np.uint64)
+        getrandbits = self.getrandbits
+        for start in range(0, n, chunk):
+            size = min(chunk, n - start)
+            nbytes = 4 * words_per_value * size
+            words = np.frombuffer(getrandbits(8 * nbytes).to_bytes(nbytes, 'little'), dtype='<u4')
+            if k <= 32:
+                result[start:start + size] = words >> np.uint32(32 - k)
+            else:
+                high = (words[1::2] >> np.uint32(64 - k)).astype(np.uint64)
+                result[start:start + size] = words[0::2] | (high << np.uint64(32))
+        return result
+
+    def _randbelow_array(self, bounds):
+        """Return a NumPy int64 array with a random int in [0, b) for each b in bounds.
+
+        Uses Lemire's multiply-and-reject method on 32-bit words pulled
+        in bulk with getrandbits(): the high half of word * b is the
+        result, and words whose low half falls below 2**32 % b are
+        redrawn, only at the rejected positions, so the result is exactly
+        uniform.  Bounds must be in [1, 2**32].
+
+        """
+        import numpy as np
+
+        bounds = np.asarray(bounds, dtype=np.uint64)
+        if bounds.size and (bounds.min() < 1 or bounds.max() > 1 << 32):
+            raise ValueError("bounds must be in [1, 2**32]")
+        threshold = ((1 << 32) - bounds) % bounds
+        result = np.empty(bounds.shape, dtype=np.int64)
+        pending = np.arange(bounds.size)
+        getrandbits = self.getrandbits
+        while pending.size:
+            size = pending.size
+            words = np.frombuffer(getrandbits(32 * size).to_bytes(4 * size, 'little'), dtype='<u4')
+            product = words.astype(np.uint64) * bounds[pending]
+            accepted = (product & np.uint64(0xFFFFFFFF)) >= threshold[pending]
+            result[pending[accepted]] = (product[accepted] >> np.uint64(32)).astype(np.int64)
+            pending = pending[~accepted]
+        return result
+
+
     ## -------------------- integer methods  -------------------
 
     def randrange(self, start, stop=None, step=_ONE):
@@ -488,6 +721,136 @@ class Random(_random.Random):
         return [population[bisect(cum_weights, random() * total, 0, hi)]
                 for i in _repeat(None, k)]
 
+    def alias_choices(self, population, weights, *, k=1):
+        """Return a k sized list of population elements chosen with replacement.
+
+        Like choices() with weights, but the draws go through an alias
+        table, O(1) each instead of a bisect over the cumulative weights.
+        weights is either a prepared AliasSampler, from alias_sampler()
+        or AliasSampler(), or a weight sequence.  Only a prepared sampler
+        makes a call independent of the number of weights: a sequence is
+        looked up with alias_sampler(), which skips rebuilding a recent
+        table but still hashes the weights on every call.  Large k are
+        drawn from a single random_array() block.
+
+        """
+        n = len(population)
+        if isinstance(weights, AliasSampler):
+            sampler = weights
+        else:
+            sampler = alias_sampler(weights)
+        if sampler.n != n:
+            raise ValueError('The number of weights does not match the population')
+        if k < _ALIAS_VECTOR_MIN:
+            index = sampler.index
+            random = self.random
+            return [population[index(random())] for i in _repeat(None, k)]
+        return list(map(population.__getitem__, sampler.indices(self.random_array(k)).tolist()))
+
+
+    ## ---------------- large sequence methods -----------------
+    ## Array-backed counterparts of shuffle() and sample() for sizes in
+    ## the tens of millions, where swapping Python objects one at a time
+    ## and keeping index sets dominate.  They draw their bounded integers
+    ## in bulk with _randbelow_array(), so they do not reproduce the
+    ## sequences of shuffle() and sample() for the same seed.
+
+    def _fisher_yates(self, x, stop):
+        """Run the Fisher-Yates steps i = len(x) - 1, ..., stop on x in place.
+
+        The swaps (i, j_i) form a sequence, but most of them touch
+        disjoint positions.  Following Shun et al., "Sequential random
+        permutation, list contraction and tree contraction are highly
+        parallel" (SODA 2015), every pending step reserves positions i and
+        j_i with priority i, and the steps holding both reservations are
+        exactly those that no earlier pending step depends on, so they are
+        applied together.  The result is the sequential permutation, in
+        O(log n) vectorized rounds.
+
+        """
+        import numpy as np
+
+        n = len(x)
+        i = np.arange(n - 1, stop - 1, -1, dtype=np.int64)
+        j = self._randbelow_array(i + 1)
+        reserved = np.full(n, -1, dtype=np.int64)
+        while i.size:
+            reserved[i] = i
+            np.maximum.at(reserved, j, i)
+            done = (reserved[i] == i) & (reserved[j] == i)
+            first, second = i[done], j[done]
+            x[first], x[second] = x[second], x[first]
+            reserved[i] = -1
+            reserved[j] = -1
+            i, j = i[~done], j[~done]
+
+    def shuffle_array(self, x):
+        """Shuffle the NumPy array x in place with a vectorized Fisher-Yates."""
+        self._fisher_yates(x, 1)
+
+    def sample_array(self, population, k):
+        """Chooses k unique random indices of population, as a NumPy int64 array.
+
+        Sparse samples (k below a quarter of the population) use Floyd's
+        algorithm, which keeps only the k chosen indices and needs one
+        bounded integer per index, and are shuffled afterwards so that
+        every slice is itself a random sample, as with sample().  Dense
+        samples run the last k Fisher-Yates steps on all the indices.
+        population is a sequence or its length; gather the elements with
+        population[result] on arrays.
+
+        """
+        import numpy as np
+
+        # Integral numpy scalars are lengths too; sequences do not support __index__
+        try:
+            n = _index(population)
+        except TypeError:
+            n = len(population)
+        if not 0 <= k <= n:
+            raise ValueError("Sample larger than population or is negative")
+        if 4 * k >= n:
+            indices = np.arange(n, dtype=np.int64)
+            self._fisher_yates(indices, n - k)
+            return indices[n - k:].copy()
+        selected = set()
+        selected_add = selected.add
+        for j, t in zip(range(n - k, n), self._randbelow_array(np.arange(n - k + 1, n + 1)).tolist()):
+            selected_add(j if t in selected else t)
+        indices = np.fromiter(selected, dtype=np.int64, count=k)
+        self.shuffle_array(indices)
+        return indices
+
+    def reservoir_sample(self, iterable, k):
+        """Chooses k unique random elements of an iterable of unknown length.
+
+        Uses Li's Algorithm L (1994): after the reservoir is full, the
+        number of elements to skip before the next replacement is drawn
+        from its geometric distribution, so only O(k log(N / k)) random
+        numbers are used and memory stays bounded by k.  Returns fewer
+        than k elements if the iterable is shorter.  The reservoir is in
+        replacement order, not a random order.
+
+        """
+        if k < 0:
+            raise ValueError("Sample size must be non-negative")
+        iterator = iter(iterable)
+        reservoir = list(_islice(iterator, k))
+        if len(reservoir) < k or k == 0:
+            return reservoir
+        random = self.random
+        randbelow = self._randbelow
+        # 1.0 - random() is in (0, 1], so the logarithms are finite
+        w = _exp(_log(1.0 - random()) / k)
+        while True:
+            skip = _floor(_log(1.0 - random()) / _log(1.0 - w)) if w < 1.0 else 0
+            for item in _islice(iterator, skip, skip + 1):
+                break
+            else:
+                return reservoir
+            reservoir[randbelow(k)] = item
+            w *= _exp(_log(1.0 - random()) / k)
+
 
     ## -------------------- real-valued distributions  -------------------
 
@@ -778,6 +1141,300 @@ class Random(_random.Random):
         return alpha * (-_log(u)) ** (1.0 / beta)
 
 
+    ## ------------- real-valued distributions, array versions -------------
+    ## Each *_array(n, ...) method returns a NumPy float64 array of n
+    ## variates drawn with the same algorithm as its scalar counterpart,
+    ## fed from a bulk random_array() block.  Rejection loops become masked
+    ## refills: a batch of candidates sized from the expected acceptance
+    ## rate is drawn, the accepted ones are kept in order and the batch is
+    ## redrawn for the remainder.  Where the scalar method consumes uniforms
+    ## in a fixed pattern (expovariate, paretovariate, weibullvariate, and
+    ## normalvariate and gammavariate with alpha <= 1), the array holds the
+    ## same variates as n scalar calls, up to the rounding of NumPy's
+    ## transcendental functions; the generator state afterwards differs,
+    ## since the last batch is drawn past the final accepted candidate.
+
+    def _rejection_array(self, n, candidates, acceptance):
+        """Fill an array of n accepted values from candidates(size).
+
+        candidates(size) returns a pair (values, accepted) of arrays of
+        size candidates and their accept mask; acceptance is the expected
+        accept rate, used only to size the batches.
+
+        """
+        import numpy as np
+
+        n = _index(n)
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        result = np.empty(n, dtype=np.float64)
+        filled = 0
+        while filled < n:
+            values, accepted = candidates(int((n - filled) / acceptance) + 16)
+            values = values[accepted][:n - filled]
+            result[filled:filled + len(values)] = values
+            filled += len(values)
+        return result
+
+    def normalvariate_array(self, n, mu=0.0, sigma=1.0):
+        """Array of n normal variates; see normalvariate()."""
+        import numpy as np
+
+        def candidates(size):
+            u = self.random_array(2 * size)
+            u1 = u[0::2]
+            u2 = 1.0 - u[1::2]
+            z = NV_MAGICCONST * (u1 - 0.5) / u2
+            return z, z * z / 4.0 <= -np.log(u2)
+
+        # The ratio-of-uniforms region covers sqrt(pi / 2) / NV_MAGICCONST
+        # of the rectangle, about 73%
+        return mu + self._rejection_array(n, candidates, 0.73) * sigma
+
+    def lognormvariate_array(self, n, mu, sigma):
+        """Array of n log normal variates; see lognormvariate()."""
+        import numpy as np
+
+        return np.exp(self.normalvariate_array(n, mu, sigma))
+
+    def expovariate_array(self, n, lambd=1.0):
+        """Array of n exponential variates; see expovariate()."""
+        import numpy as np
+
+        return -np.log(1.0 - self.random_array(n)) / lambd
+
+    def vonmisesvariate_array(self, n, mu, kappa):
+        """Array of n von Mises variates; see vonmisesvariate().
+
+        The final coin flip u3 is drawn as a separate block instead of
+        after each accepted candidate, so the values match the scalar
+        method in distribution only.
+
+        """
+        import numpy as np
+
+        if kappa <= 1e-6:
+            return TWOPI * self.random_array(n)
+
+        s = 0.5 / kappa
+        r = s + _sqrt(1.0 + s * s)
+
+        def candidates(size):
+            u = self.random_array(2 * size)
+            z = np.cos(_pi * u[0::2])
+            d = z / (r + z)
+            u2 = u[1::2]
+            return z, (u2 < 1.0 - d * d) | (u2 <= (1.0 - d) * np.exp(d))
+
+        z = self._rejection_array(n, candidates, 0.65)
+        q = 1.0 / r
+        f = (q + z) / (1.0 + q * z)
+        u3 = self.random_array(n)
+        return np.where(u3 > 0.5, mu + np.arccos(f), mu - np.arccos(f)) % TWOPI
+
+    def gammavariate_array(self, n, alpha, beta):
+        """Array of n gamma variates; see gammavariate().
+
+        For alpha > 1 the scalar method redraws u1 alone when it falls
+        outside (1e-7, 0.9999999); here the whole pair is rejected, which
+        leaves the distribution unchanged but not the sequence.
+
+        """
+        import numpy as np
+
+        if alpha <= 0.0 or beta <= 0.0:
+            raise ValueError('gammavariate_array: alpha and beta must be > 0.0')
+
+        if alpha > 1.0:
+            ainv = _sqrt(2.0 * alpha - 1.0)
+            bbb = alpha - LOG4
+            ccc = alpha + ainv
+
+            def candidates(size):
+                u = self.random_array(2 * size)
+                u1 = u[0::2]
+                valid = (1e-7 < u1) & (u1 < 0.9999999)
+                u1 = np.where(valid, u1, 0.5)
+                u2 = 1.0 - u[1::2]
+                v = np.log(u1 / (1.0 - u1)) / ainv
+                x = alpha * np.exp(v)
+                z = u1 * u1 * u2
+                r = bbb + ccc * v - x
+                return x, valid & ((r + SG_MAGICCONST - 4.5 * z >= 0.0) | (r >= np.log(z)))
+
+            # Cheng's algorithm accepts at least 73% of the pairs for alpha > 1
+            return self._rejection_array(n, candidates, 0.73) * beta
+
+        if alpha == 1.0:
+            return -np.log(1.0 - self.random_array(n)) * beta
+
+        b = (_e + alpha) / _e
+
+        def candidates(size):
+            u = self.random_array(2 * size)
+            p = b * u[0::2]
+            u1 = u[1::2]
+            below = p <= 1.0
+            with np.errstate(divide='ignore', over='ignore'):
+                x = np.where(below, p ** (1.0 / alpha), -np.log(np.where(below, alpha, b - p) / alpha))
+                accepted = np.where(below, u1 <= np.exp(-x), u1 <= x ** (alpha - 1.0))
+            return x, accepted
+
+        # Algorithm GS accepts at least 72% of the pairs for 0 < alpha < 1
+        return self._rejection_array(n, candidates, 0.72) * beta
+
+    def betavariate_array(self, n, alpha, beta):
+        """Array of n beta variates; see betavariate()."""
+        import numpy as np
+
+        y = self.gammavariate_array(n, alpha, 1.0)
+        z = self.gammavariate_array(n, beta, 1.0)
+        with np.errstate(invalid='ignore'):
+            return np.where(y != 0.0, y / (y + z), 0.0)
+
+    def paretovariate_array(self, n, alpha):
+        """Array of n Pareto variates; see paretovariate()."""
+        return (1.0 - self.random_array(n)) ** (-1.0 / alpha)
+
+    def weibullvariate_array(self, n, alpha, beta):
+        """Array of n Weibull variates; see weibullvariate()."""
+        import numpy as np
+
+        return alpha * (-np.log(1.0 - self.random_array(n))) ** (1.0 / beta)
+
+
+    ## ------------------ ziggurat distributions ---------------------
+    ## Marsaglia and Tsang's Ziggurat: the area under the density is
+    ## covered by layers of equal area, so most draws are one 64-bit word
+    ## and one comparison, with no log, exp or trigonometric call.  As in
+    ## Doornik's "An improved ziggurat method" (2005), the layer index and
+    ## the sign come from the low bits of the word and the uniform from
+    ## its 53 high bits, so they are independent.  The methods produce
+    ## different sequences than normalvariate() and expovariate().
+
+    def _normal_tail(self):
+        # Marsaglia (1964): the normal tail beyond R from two exponentials
+        r = ZIGGURAT_NORMAL[1]
+        random = self.random
+        while True:
+            x = -_log(1.0 - random()) / r
+            y = -_log(1.0 - random())
+            if y + y >= x * x:
+                return r + x
+
+    def normal(self, mu=0.0, sigma=1.0):
+        """Normal distribution, sampled with the Ziggurat method.
+
+        mu is the mean, and sigma is the standard deviation.
+
+        """
+        k, w, f = _NORMAL_TABLES
+        getrandbits = self.getrandbits
+        while True:
+            word = getrandbits(64)
+            i = word & 0x7F
+            j = word >> 11
+            x = j * w[i]
+            if j < k[i]:
+                break
+            if i == 0:
+                x = self._normal_tail()
+                break
+            if f[i] + self.random() * (f[i + 1] - f[i]) < _exp(-0.5 * x * x):
+                break
+        return mu + (-x if word & 0x80 else x) * sigma
+
+    def exponential(self, lambd=1.0):
+        """Exponential distribution, sampled with the Ziggurat method.
+
+        lambd is 1.0 divided by the desired mean, as in expovariate().
+
+        """
+        k, w, f = _EXPONENTIAL_TABLES
+        getrandbits = self.getrandbits
+        while True:
+            word = getrandbits(64)
+            i = word & 0xFF
+            j = word >> 11
+            x = j * w[i]
+            if j < k[i]:
+                break
+            if i == 0:
+                # The exponential is memoryless, so its tail is R plus a fresh variate
+                x = ZIGGURAT_EXPONENTIAL[1] - _log(1.0 - self.random())
+                break
+            if f[i] + self.random() * (f[i + 1] - f[i]) < _exp(-x):
+                break
+        return x / lambd
+
+    def _ziggurat_array(self, n, tables, index_bits, tail, density, signed):
+        """Vectorized Ziggurat: n variates from the layer tables as a NumPy array.
+
+        Each candidate takes a 64-bit word: layers below the curve accept
+        immediately, base layer candidates are replaced by tail(count)
+        and wedge candidates draw one uniform for the density test;
+        rejected wedges are refilled by _rejection_array().  If signed,
+        the word bit above the layer index gives the sign.
+
+        """
+        import numpy as np
+
+        k, w, f = _ziggurat_arrays(tables)
+        mask = np.uint64((1 << index_bits) - 1)
+
+        def candidates(size):
+            words = self.getrandbits_array(size, 64)
+            i = (words & mask).astype(np.intp)
+            j = words >> np.uint64(11)
+            x = j * w[i]
+            accepted = j < k[i]
+            # Only the few candidates outside the layer rectangles are handled one index set at a time
+            slow = np.flatnonzero(~accepted)
+            base = slow[i[slow] == 0]
+            wedge = slow[i[slow] != 0]
+            x[base] = tail(base.size)
+            accepted[base] = True
+            iw = i[wedge]
+            y = f[iw] + self.random_array(wedge.size) * (f[iw + 1] - f[iw])
+            accepted[wedge] = y < density(x[wedge])
+            if signed:
+                x = np.where(words & np.uint64(1 << index_bits), -x, x)
+            return x, accepted
+
+        return self._rejection_array(n, candidates, 0.98)
+
+    def _normal_tail_array(self, n):
+        import numpy as np
+
+        r = ZIGGURAT_NORMAL[1]
+
+        def candidates(size):
+            u = self.random_array(2 * size)
+            x = -np.log(1.0 - u[0::2]) / r
+            y = -np.log(1.0 - u[1::2])
+            return r + x, y + y >= x * x
+
+        return self._rejection_array(n, candidates, 0.9)
+
+    def normal_array(self, n, mu=0.0, sigma=1.0):
+        """Array of n normal variates; see normal()."""
+        import numpy as np
+
+        x = self._ziggurat_array(n, _NORMAL_TABLES, 7, self._normal_tail_array,
+                                 lambda x: np.exp(-0.5 * x * x), True)
+        return mu + x * sigma
+
+    def exponential_array(self, n, lambd=1.0):
+        """Array of n exponential variates; see exponential()."""
+        import numpy as np
+
+        r = ZIGGURAT_EXPONENTIAL[1]
+        x = self._ziggurat_array(n, _EXPONENTIAL_TABLES, 8,
+                                 lambda count: r - np.log(1.0 - self.random_array(count)),
+                                 lambda x: np.exp(-x), False)
+        return x / lambd
+
+
     ## -------------------- discrete  distributions  ---------------------
 
     def binomialvariate(self, n=1, p=0.5):
@@ -920,27 +1577,45 @@ class SystemRandom(Random):
 _inst = Random()
 seed = _inst.seed
 random = _inst.random
+random_array = _inst.random_array
 uniform = _inst.uniform
 triangular = _inst.triangular
 randint = _inst.randint
 choice = _inst.choice
 randrange = _inst.randrange
 sample = _inst.sample
+sample_array = _inst.sample_array
 shuffle = _inst.shuffle
+shuffle_array = _inst.shuffle_array
+reservoir_sample = _inst.reservoir_sample
 choices = _inst.choices
+alias_choices = _inst.alias_choices
 normalvariate = _inst.normalvariate
+normalvariate_array = _inst.normalvariate_array
 lognormvariate = _inst.lognormvariate
+lognormvariate_array = _inst.lognormvariate_array
 expovariate = _inst.expovariate
+expovariate_array = _inst.expovariate_array
+exponential = _inst.exponential
+exponential_array = _inst.exponential_array
+normal = _inst.normal
+normal_array = _inst.normal_array
 vonmisesvariate = _inst.vonmisesvariate
+vonmisesvariate_array = _inst.vonmisesvariate_array
 gammavariate = _inst.gammavariate
+gammavariate_array = _inst.gammavariate_array
 gauss = _inst.gauss
 betavariate = _inst.betavariate
+betavariate_array = _inst.betavariate_array
 binomialvariate = _inst.binomialvariate
 paretovariate = _inst.paretovariate
+paretovariate_array = _inst.paretovariate_array
 weibullvariate = _inst.weibullvariate
+weibullvariate_array = _inst.weibullvariate_array
 getstate = _inst.getstate
 setstate = _inst.setstate
 getrandbits = _inst.getrandbits
+getrandbits_array = _inst.getrandbits_array
 randbytes = _inst.randbytes
 
 
@@ -964,6 +1639,137 @@ def _test_generator(n, func, args):
     print('avg %g, stddev %g, min %g, max %g\n' % (xbar, sigma, low, high))
 
 
+def _ks_distance(xs, ys):
+    """Two-sample Kolmogorov-Smirnov statistic: the largest distance
+    between the empirical distribution functions of xs and ys."""
+    import numpy as np
+
+    xs, ys = np.sort(xs), np.sort(ys)
+    points = np.concatenate((xs, ys))
+    fx = np.searchsorted(xs, points, side='right') / xs.size
+    fy = np.searchsorted(ys, points, side='right') / ys.size
+    return float(np.max(np.abs(fx - fy)))
+
+
+def _test_array_generator(n, func, scalar, args, exact=False):
+    """Compare an *_array method against n calls of its scalar version.
+
+    Prints both timings and summary statistics.  With exact, the values
+    drawn from the same seed must also agree up to rounding.  Otherwise
+    the two are drawn from different seeds and must agree in
+    distribution: the means within four standard errors, and the
+    Kolmogorov-Smirnov distance below its critical value at the 0.1%
+    level, 1.95 * sqrt(2 / n).
+
+    """
+    from statistics import stdev, variance, fmean as mean
+    from time import perf_counter
+    from math import isclose
+
+    seed(12345)
+    t0 = perf_counter()
+    expected = [scalar(*args) for i in _repeat(None, n)]
+    t1 = perf_counter()
+    seed(12345 if exact else 54321)
+    data = func(n, *args).tolist()
+    t2 = perf_counter()
+
+    name = f'{func.__name__}{args!r}'
+    if exact:
+        assert all(isclose(x, y, rel_tol=1e-12) for x, y in zip(data, expected)), name
+    else:
+        error = _sqrt((variance(data) + variance(expected)) / n)
+        assert abs(mean(data) - mean(expected)) < 4.0 * error, name
+        assert _ks_distance(data, expected) < 1.95 * _sqrt(2.0 / n), name
+    print(f'{t1 - t0:.3f} sec scalar, {t2 - t1:.3f} sec array, {n} times {func.__name__}{args!r}')
+    print('avg %g, stddev %g, min %g, max %g' % (mean(expected), stdev(expected), min(expected), max(expected)))
+    print('avg %g, stddev %g, min %g, max %g\n' % (mean(data), stdev(data), min(data), max(data)))
+
+
+def _test_arrays(N=10_000):
+    # Array methods that consume uniforms in the same pattern as the
+    # scalar ones reproduce their values; the rest match in distribution
+    _test_array_generator(N, normalvariate_array, normalvariate, (0.0, 1.0), exact=True)
+    _test_array_generator(N, lognormvariate_array, lognormvariate, (0.0, 1.0), exact=True)
+    _test_array_generator(N, expovariate_array, expovariate, (2.0,), exact=True)
+    _test_array_generator(N, vonmisesvariate_array, vonmisesvariate, (0.0, 1.0))
+    _test_array_generator(N, gammavariate_array, gammavariate, (0.1, 1.0), exact=True)
+    _test_array_generator(N, gammavariate_array, gammavariate, (0.9, 1.0), exact=True)
+    _test_array_generator(N, gammavariate_array, gammavariate, (1.0, 1.0), exact=True)
+    _test_array_generator(N, gammavariate_array, gammavariate, (2.0, 1.0))
+    _test_array_generator(N, gammavariate_array, gammavariate, (200.0, 1.0))
+    _test_array_generator(N, betavariate_array, betavariate, (3.0, 3.0))
+    _test_array_generator(N, paretovariate_array, paretovariate, (2.5,), exact=True)
+    _test_array_generator(N, weibullvariate_array, weibullvariate, (1.0, 1.5), exact=True)
+    _test_array_generator(N, normal_array, normal, (0.0, 1.0))
+    _test_array_generator(N, exponential_array, exponential, (1.0,))
+
+
+def _ks_cdf(data, cdf):
+    """One-sample Kolmogorov-Smirnov statistic: the largest distance
+    between the empirical distribution function of data and cdf."""
+    import numpy as np
+
+    f = np.array([cdf(x) for x in sorted(data)])
+    steps = np.arange(len(f) + 1) / len(f)
+    return float(max(np.max(steps[1:] - f), np.max(f - steps[:-1])))
+
+
+def _test_ziggurat(name, data, tables, cdf, signed):
+    """Check Ziggurat variates against cdf, the distribution function of
+    their absolute value.
+
+    Asserts, at about the 0.1% level, the Kolmogorov-Smirnov distance
+    to cdf, the balance of signs when signed, the mass of the tail
+    beyond R and its distribution, and a chi-square over the bands
+    between consecutive layer edges, whose counts include the wedge
+    rejections of every layer.
+
+    """
+    import numpy as np
+
+    n = len(data)
+    x = np.abs(np.asarray(data, dtype=float))
+    distance = _ks_cdf(x.tolist(), cdf)
+    assert distance < 1.95 / _sqrt(n), name
+    if signed:
+        negative = int(np.count_nonzero(np.asarray(data) < 0.0))
+        assert abs(negative - 0.5 * n) < 2.0 * _sqrt(n), name
+
+    k, w, _ = tables
+    edges = sorted(wi * 2.0 ** BPF for wi in w[1:]) + [float('inf')]
+    r = edges[-2]
+    tail = x[x >= r].tolist()
+    outside = 1.0 - cdf(r)
+    assert abs(len(tail) - n * outside) < 4.0 * _sqrt(n * outside), name
+    tail_distance = _ks_cdf(tail, lambda v: 1.0 - (1.0 - cdf(v)) / outside)
+    assert tail_distance < 1.95 / _sqrt(len(tail)), name
+
+    observed, _ = np.histogram(x, bins=edges)
+    expected = n * np.diff([cdf(e) if e != float('inf') else 1.0 for e in edges])
+    chi = float(np.sum((observed - expected) ** 2 / expected))
+    # Wilson-Hilferty approximation of the 99.9% chi-square quantile
+    df = len(expected) - 1
+    critical = df * (1.0 - 2.0 / (9.0 * df) + 3.09 * _sqrt(2.0 / (9.0 * df))) ** 3
+    assert chi < critical, name
+    print(f'{n} times {name}: KS {distance:.4f}, tail {len(tail)} of {n * outside:.1f} '
+          f'(KS {tail_distance:.3f}), chi-square {chi:.1f} < {critical:.1f} ({df} df)\n')
+
+
+def _test_ziggurats(N=1_000_000):
+    # Enough samples for hundreds of draws from the tails and for the
+    # wedges to show in the layer counts
+    from math import erf
+
+    half_normal = lambda x: erf(x / _sqrt(2.0))
+    exponential_cdf = lambda x: 1.0 - _exp(-x)
+    seed(12345)
+    _test_ziggurat('normal', [normal() for i in _repeat(None, N)], _NORMAL_TABLES, half_normal, True)
+    _test_ziggurat('normal_array', normal_array(N), _NORMAL_TABLES, half_normal, True)
+    _test_ziggurat('exponential', [exponential() for i in _repeat(None, N)], _EXPONENTIAL_TABLES, exponential_cdf, False)
+    _test_ziggurat('exponential_array', exponential_array(N), _EXPONENTIAL_TABLES, exponential_cdf, False)
+
+
 def _test(N=10_000):
     _test_generator(N, random, ())
     _test_generator(N, normalvariate, (0.0, 1.0))
@@ -981,8 +1787,12 @@ def _test(N=10_000):
     _test_generator(N, gammavariate, (20.0, 1.0))
     _test_generator(N, gammavariate, (200.0, 1.0))
     _test_generator(N, gauss, (0.0, 1.0))
+    _test_generator(N, normal, (0.0, 1.0))
+    _test_generator(N, exponential, (1.0,))
     _test_generator(N, betavariate, (3.0, 3.0))
     _test_generator(N, triangular, (0.0, 1.0, 1.0 / 3.0))
+    _test_arrays(N)
+    _test_ziggurats()
 
 
 ## ------------------------------------------------------
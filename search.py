@@ -0,0 +1,134 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import count, islice, takewhile
+from typing import Iterator, Optional
+import argparse
+import heapq
+import json
+import os
+import period
+import spectral
+
+def full_period(a: int, m: int, c: int, factors: dict[int, int], order_primes: list[int]) -> bool:
+    """
+    Full-period check with a precomputed factorization of m: the Hull-Dobell conditions for mixed LCGs
+    (c != 0), or a multiplier of maximal order lambda(m) for multiplicative ones (c == 0)
+    :param order_primes: the prime factors of lambda(m)
+    """
+    if c % m:
+        return (
+            all((a - 1) % p == 0 for p in factors)
+            and (m % 4 != 0 or (a - 1) % 4 == 0)
+            and all(c % p != 0 for p in factors)
+        )
+    if any(a % p == 0 for p in factors):
+        return False
+    order = period.carmichael(factors)
+    return all(pow(a, order // q, m) != 1 for q in order_primes)
+
+
+def evaluate(a: int, m: int, c: int, factors: dict[int, int], order_primes: list[int], max_dimension: int) -> Optional[tuple[float, int, list[float]]]:
+    """
+    Worker of the search: filters the multiplier by the full-period check and scores it by the worst
+    normalized spectral figure of merit, min S_t for t in 2..max_dimension
+    :return: (score, a, [S_2, ..., S_max_dimension]), or None if a does not have full period
+    """
+    if not full_period(a, m, c, factors, order_primes):
+        return None
+    figures = [f.normalized for f in spectral.spectral_test(m, a, max_dimension)]
+    return min(figures), a, figures
+
+
+def candidates(start: int, step: int, m: int, position: int) -> Iterator[int]:
+    """
+    Lazily enumerates the multipliers start, start + step, ... below m, skipping the first `position`
+    """
+    return takewhile(lambda a: a < m, (start + i * step for i in count(position)))
+
+
+def save_checkpoint(path: str, state: dict) -> None:
+    partial_path = path + ".partial"
+    with open(partial_path, "w") as f:
+        json.dump(state, f)
+    os.replace(partial_path, path)
+
+
+def search(args) -> list[tuple[float, int, list[float]]]:
+    """
+    Scans the candidate multipliers in batches on a process pool, keeping the top-K in a min-heap.
+    Memory is bounded by the batch size, and the heap plus the scan position are checkpointed after
+    every batch so a run can be resumed
+    """
+    m, c = args.lcg_modulus, args.lcg_increment
+    state = {"m": m, "c": c, "start": args.start, "step": args.step, "max_dimension": args.max_dimension, "position": 0, "top": []}
+    if args.resume and args.checkpoint and os.path.exists(args.checkpoint):
+        with open(args.checkpoint) as f:
+            saved = json.load(f)
+        if any(saved[key] != state[key] for key in ("m", "c", "start", "step", "max_dimension")):
+            raise ValueError("O checkpoint foi gerado com outros parâmetros de busca")
+        state = saved
+        print(f"Retomando a busca a partir do candidato {state['position']}")
+
+    top = [(score, a, figures) for score, a, figures in state["top"]]
+    heapq.heapify(top)
+    factors = period.factorize(m)
+    order_primes = sorted(period.factorize(period.carmichael(factors)))
+    task = partial(evaluate, m=m, c=c, factors=factors, order_primes=order_primes, max_dimension=args.max_dimension)
+
+    remaining = args.count - state["position"] if args.count is not None else None
+    stream = candidates(args.start, args.step, m, state["position"])
+    if remaining is not None:
+        stream = islice(stream, max(remaining, 0))
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        while True:
+            batch = list(islice(stream, args.batch_size))
+            if not batch:
+                break
+            for result in pool.map(task, batch, chunksize=max(1, len(batch) // (4 * args.workers))):
+                if result is None:
+                    continue
+                if len(top) < args.top:
+                    heapq.heappush(top, result)
+                elif result > top[0]:
+                    heapq.heapreplace(top, result)
+            state["position"] += len(batch)
+            state["top"] = top
+            if args.checkpoint:
+                save_checkpoint(args.checkpoint, state)
+            print(f"Candidatos avaliados: {state['position']}, melhor M_t: {max(top)[0] if top else float('nan'):.4f}")
+
+    return sorted(top, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Busca de multiplicadores do LCG ranqueados pelo teste espectral")
+
+    parser.add_argument("--lcg_modulus", type=int, default=2**32, help="Módulo 'm' do LCG")
+    parser.add_argument("--lcg_increment", type=int, default=0, help="Incremento 'c' do LCG")
+    parser.add_argument("--start", type=int, default=3, help="Primeiro multiplicador candidato")
+    parser.add_argument("--step", type=int, default=2, help="Distância entre multiplicadores candidatos consecutivos")
+    parser.add_argument("--count", type=int, required=False, help="Número de candidatos avaliados, padrão: até alcançar o módulo")
+    parser.add_argument("--top", type=int, default=10, help="Quantidade de melhores multiplicadores mantidos")
+    parser.add_argument("--max_dimension", type=int, default=spectral.MAX_DIMENSION, help="Maior dimensão do teste espectral")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Número de processos")
+    parser.add_argument("--batch_size", type=int, default=10_000, help="Candidatos avaliados entre checkpoints")
+    parser.add_argument("--checkpoint", type=str, required=False, help="Arquivo JSON de checkpoint da busca")
+    parser.add_argument("--resume", action="store_true", help="Retoma a busca a partir do checkpoint")
+
+    args = parser.parse_args()
+
+    if not spectral.MIN_DIMENSION <= args.max_dimension <= spectral.MAX_DIMENSION:
+        raise ValueError(f"max_dimension deve estar entre {spectral.MIN_DIMENSION} e {spectral.MAX_DIMENSION}")
+    if args.step < 1 or args.workers < 1 or args.batch_size < 1 or args.top < 1:
+        raise ValueError("step, workers, batch_size e top devem ser maiores ou iguais a 1")
+
+    top = search(args)
+
+    dimensions = range(spectral.MIN_DIMENSION, args.max_dimension + 1)
+    print(f"\n{'a':>22} {'M_t':>8} " + " ".join(f"{'S_' + str(t):>6}" for t in dimensions))
+    for score, a, figures in top:
+        print(f"{a:>22} {score:>8.4f} " + " ".join(f"{s:>6.4f}" for s in figures))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from math import ceil, floor, gamma, pi, sqrt
+
+MIN_DIMENSION = 2
+MAX_DIMENSION = 8
+# Hermite constants gamma_t, the largest possible nu_t^2 / m^(2/t) of any lattice, known exactly for t <= 8
+HERMITE_CONSTANTS = {
+    2: (4 / 3) ** (1 / 2),
+    3: 2 ** (1 / 3),
+    4: 2 ** (1 / 2),
+    5: 8 ** (1 / 5),
+    6: (64 / 3) ** (1 / 6),
+    7: 64 ** (1 / 7),
+    8: 2.0,
+}
+# Relative slack of the enumeration bounds, which are evaluated in floating point
+_ENUMERATION_SLACK = 1e-9
+
+@dataclass(frozen=True)
+class SpectralFigures:
+    dimension: int
+    nu_squared: int
+    # nu_t: the distance between adjacent hyperplanes covering the t-dimensional points is 1 / nu_t
+    nu: float
+    # Knuth's figure of merit mu_t = pi^(t/2) nu_t^t / ((t/2)! m); values below 0.1 are bad
+    mu: float
+    # L'Ecuyer's normalized figure of merit S_t = nu_t / (sqrt(gamma_t) m^(1/t)), in (0, 1]
+    normalized: float
+
+
+def _dot(u: list[int], v: list[int]) -> int:
+    return sum(x * y for x, y in zip(u, v))
+
+
+def lll_reduce(basis: list[list[int]]) -> list[list[int]]:
+    """
+    LLL reduction (delta = 3/4) of a basis of integer vectors with exact integer arithmetic
+    (Cohen, "A Course in Computational Algebraic Number Theory", algorithm 2.6.7)
+    :param basis: linearly independent integer vectors
+    :return: an LLL-reduced basis of the same lattice
+    """
+    b = [list(v) for v in basis]
+    n = len(b)
+    d = [1] + [0] * n
+    lam = [[0] * n for _ in range(n)]
+
+    def reduce(k: int, l: int) -> None:
+        if 2 * abs(lam[k][l]) > d[l + 1]:
+            q = (2 * lam[k][l] + d[l + 1]) // (2 * d[l + 1])
+            b[k] = [x - q * y for x, y in zip(b[k], b[l])]
+            lam[k][l] -= q * d[l + 1]
+            for i in range(l):
+                lam[k][i] -= q * lam[l][i]
+
+    def swap(k: int, kmax: int) -> None:
+        b[k], b[k - 1] = b[k - 1], b[k]
+        for j in range(k - 1):
+            lam[k][j], lam[k - 1][j] = lam[k - 1][j], lam[k][j]
+        mu = lam[k][k - 1]
+        new_d = (d[k - 1] * d[k + 1] + mu * mu) // d[k]
+        for i in range(k + 1, kmax + 1):
+            t = lam[i][k]
+            lam[i][k] = (d[k + 1] * lam[i][k - 1] - mu * t) // d[k]
+            lam[i][k - 1] = (new_d * t + mu * lam[i][k]) // d[k + 1]
+        d[k] = new_d
+
+    d[1] = _dot(b[0], b[0])
+    k, kmax = 1, 0
+    while k < n:
+        if k > kmax:
+            # Incremental Gram-Schmidt
+            kmax = k
+            for j in range(k + 1):
+                u = _dot(b[k], b[j])
+                for i in range(j):
+                    u = (d[i + 1] * u - lam[k][i] * lam[j][i]) // d[i]
+                if j < k:
+                    lam[k][j] = u
+                else:
+                    d[k + 1] = u
+        reduce(k, k - 1)
+        if 4 * d[k + 1] * d[k - 1] < 3 * d[k] * d[k] - 4 * lam[k][k - 1] ** 2:
+            swap(k, kmax)
+            k = max(1, k - 1)
+        else:
+            for l in range(k - 2, -1, -1):
+                reduce(k, l)
+            k += 1
+    return b
+
+
+def shortest_vector_squared(basis: list[list[int]]) -> int:
+    """
+    Exact squared length of the shortest non-zero vector of the lattice, by Fincke-Pohst enumeration
+    over an LLL-reduced basis
+    """
+    b = lll_reduce(basis)
+    n = len(b)
+    # Floating point Gram-Schmidt, only used to bound the enumeration
+    mu = [[0.0] * n for _ in range(n)]
+    norms = [0.0] * n
+    orthogonal: list[list[float]] = []
+    for i in range(n):
+        v = [float(x) for x in b[i]]
+        for j in range(i):
+            mu[i][j] = sum(x * y for x, y in zip(b[i], orthogonal[j])) / norms[j]
+            v = [x - mu[i][j] * y for x, y in zip(v, orthogonal[j])]
+        orthogonal.append(v)
+        norms[i] = sum(x * x for x in v)
+
+    best = min(_dot(v, v) for v in b)
+    coeffs = [0] * n
+
+    def search(level: int, partial: float) -> None:
+        nonlocal best
+        center = -sum(coeffs[j] * mu[j][level] for j in range(level + 1, n))
+        bound = best * (1 + _ENUMERATION_SLACK)
+        radius = sqrt(max(0.0, bound - partial) / norms[level])
+        for x in range(ceil(center - radius), floor(center + radius) + 1):
+            coeffs[level] = x
+            length = partial + (x - center) ** 2 * norms[level]
+            if length > best * (1 + _ENUMERATION_SLACK):
+                continue
+            if level > 0:
+                search(level - 1, length)
+            elif any(coeffs):
+                vector = [sum(c * v[i] for c, v in zip(coeffs, b)) for i in range(len(b[0]))]
+                best = min(best, _dot(vector, vector))
+        coeffs[level] = 0
+
+    search(n - 1, 0.0)
+    return best
+
+
+def dual_lattice_basis(m: int, a: int, dimension: int) -> list[list[int]]:
+    """
+    Basis of the lattice of integer vectors s with s_1 + a s_2 + ... + a^(t-1) s_t = 0 (mod m), whose
+    shortest vector gives the spacing of the hyperplanes covering the points (x_n, ..., x_(n+t-1)) / m
+    """
+    basis = [[m] + [0] * (dimension - 1)]
+    for i in range(1, dimension):
+        row = [0] * dimension
+        row[0], row[i] = -pow(a, i, m), 1
+        basis.append(row)
+    return basis
+
+
+@lru_cache(maxsize=1024)
+def spectral_test(m: int, a: int, max_dimension: int = MAX_DIMENSION) -> tuple[SpectralFigures, ...]:
+    """
+    Spectral test of the multiplier a for the modulus m. The increment does not change the lattice,
+    so results are cached per (m, a)
+    :return: the figures of merit for dimensions 2 to max_dimension
+    """
+    figures = []
+    for t in range(MIN_DIMENSION, max_dimension + 1):
+        nu_squared = shortest_vector_squared(dual_lattice_basis(m, a, t))
+        nu = sqrt(nu_squared)
+        mu = pi ** (t / 2) * nu ** t / (gamma(t / 2 + 1) * m)
+        normalized = nu / (sqrt(HERMITE_CONSTANTS[t]) * m ** (1 / t))
+        figures.append(SpectralFigures(t, nu_squared, nu, mu, normalized))
+    return tuple(figures)
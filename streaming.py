@@ -0,0 +1,177 @@
+from typing import Iterable, Iterator
+import math
+import numpy as np
+
+# Default number of samples held in memory at once by the streaming pipeline
+DEFAULT_CHUNK_SIZE = 1 << 20
+# Largest magnitude whose square still fits in an int64
+_MAX_INT64_SQUARE_ROOT = 3_037_000_499
+
+def scale_chunks(chunks: Iterable[np.ndarray], range_start: int, range_end: int) -> Iterator[np.ndarray]:
+    """
+    Maps chunks of floats in [0, 1) to integers with int(num * (range_end - range_start)) + range_start
+    :param chunks: an iterable of float64 arrays
+    :return: an iterator over the corresponding int64 arrays
+    """
+    width = range_end - range_start
+    for chunk in chunks:
+        # Floats are non-negative, so astype truncates like int()
+        yield (chunk * width).astype(np.int64) + range_start
+
+
+def _exact_sum(x: np.ndarray) -> int:
+    """
+    Computes sum(x) of an int64 array without overflow, returning a Python int
+    """
+    if len(x) == 0:
+        return 0
+    step = max(1, (2**63 - 1) // max(int(np.abs(x).max()), 1))
+    return sum(int(x[i:i + step].sum()) for i in range(0, len(x), step))
+
+
+def _exact_sum_of_products(x: np.ndarray, y: np.ndarray) -> int:
+    """
+    Computes sum(x * y) of two int64 arrays without overflow, returning a Python int
+    """
+    if len(x) == 0:
+        return 0
+    largest = max(int(np.abs(x).max()), int(np.abs(y).max()), 1)
+    if largest > _MAX_INT64_SQUARE_ROOT:
+        return int(np.dot(x.astype(object), y.astype(object)))
+    step = max(1, (2**63 - 1) // (largest * largest))
+    return sum(int(np.dot(x[i:i + step], y[i:i + step])) for i in range(0, len(x), step))
+
+
+def _boundary_products(left: list[int], right: list[int], lag: int) -> int:
+    """
+    Sum of the lag-`lag` products x[j - lag] * x[j] of the sequence left + right whose second factor is in right
+    :param left: the last values of the first part of the sequence (at least `lag` of them, unless it is shorter)
+    :param right: the first values of the second part
+    """
+    joined = left + right
+    return sum(joined[j - lag] * joined[j] for j in range(max(len(left), lag), len(joined)))
+
+
+class StreamStatistics:
+    """
+    One-pass accumulator of the statistics reported by run_test_cases: the histogram used by the
+    chi-square test and exact integer sums for the lag-k autocorrelations. Besides the sums, only the first
+    and last max(lags) values are kept, for the pairs that straddle chunk boundaries, so memory is O(bins).
+    Accumulators of consecutive parts of a sequence (chunks, or slices generated by worker processes)
+    merge exactly with merge()
+    """
+
+    def __init__(self, bins: int, range_: tuple[int, int], lags: tuple[int, ...] = (1,)):
+        if not lags or min(lags) < 1:
+            raise ValueError("lags must be positive")
+        self.bins = bins
+        self.range = range_
+        self.lags = tuple(lags)
+        self.edges = np.histogram_bin_edges([], bins=bins, range=range_)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.n = 0
+        self.total = 0
+        self.total_squares = 0
+        self.lag_products = [0] * len(self.lags)
+        self.head = []
+        self.tail = []
+
+    def _bin_counts(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Histogram of an integer chunk, as np.histogram(chunk, bins, range) computes it: bin i holds the values v
+        with range_start + i * width / bins <= v < range_start + (i + 1) * width / bins, plus range_end in the last
+        bin. The bin indices are computed in exact integer arithmetic and counted with np.bincount
+        """
+        start, end = self.range
+        width = end - start
+        if len(chunk) and int(chunk.min()) >= start and int(chunk.max()) <= end and width * self.bins < 2**63:
+            indices = np.minimum((chunk - start) * self.bins // width, self.bins - 1)
+        else:
+            chunk = chunk[(chunk >= start) & (chunk <= end)]
+            indices = np.minimum((chunk.astype(object) - start) * self.bins // width, self.bins - 1).astype(np.int64)
+        return np.bincount(indices, minlength=self.bins)
+
+    def update(self, chunk: np.ndarray) -> None:
+        """
+        Adds the next chunk of the integer sequence
+        """
+        if len(chunk) == 0:
+            return
+        self.counts += self._bin_counts(chunk)
+        self.n += len(chunk)
+        self.total += _exact_sum(chunk)
+        self.total_squares += _exact_sum_of_products(chunk, chunk)
+        window = max(self.lags)
+        right = chunk[:window].tolist()
+        for index, lag in enumerate(self.lags):
+            self.lag_products[index] += _exact_sum_of_products(chunk[:-lag], chunk[lag:]) if len(chunk) > lag else 0
+            # Pairs formed across the chunk boundary
+            self.lag_products[index] += _boundary_products(self.tail, right[:lag], lag)
+        self.head = (self.head + right)[:window]
+        self.tail = (self.tail + chunk[-window:].tolist())[-window:]
+
+    def merge(self, other: "StreamStatistics") -> None:
+        """
+        Adds the statistics of the part of the sequence that directly follows the one accumulated so far
+        """
+        if (other.bins, other.range, other.lags) != (self.bins, self.range, self.lags):
+            raise ValueError("only accumulators with the same bins, range and lags can be merged")
+        window = max(self.lags)
+        self.counts += other.counts
+        self.n += other.n
+        self.total += other.total
+        self.total_squares += other.total_squares
+        for index, lag in enumerate(self.lags):
+            self.lag_products[index] += other.lag_products[index] + _boundary_products(self.tail, other.head[:lag], lag)
+        self.head = (self.head + other.head)[:window]
+        self.tail = (self.tail + other.tail)[-window:]
+
+    def getstate(self) -> tuple[dict, np.ndarray]:
+        """
+        :return: the accumulated sums (Python ints, JSON serializable) and the histogram counts
+        """
+        sums = {key: getattr(self, key) for key in ("n", "total", "total_squares", "lag_products", "head", "tail")}
+        return sums, self.counts.copy()
+
+    def setstate(self, state: tuple[dict, np.ndarray]) -> None:
+        """
+        Restores the sums and counts returned by getstate() of an accumulator with the same bins, range and lags
+        """
+        sums, counts = state
+        if len(counts) != self.bins or len(sums["lag_products"]) != len(self.lags):
+            raise ValueError(f"expected {self.bins} bins and {len(self.lags)} lags")
+        for key, value in sums.items():
+            setattr(self, key, value)
+        self.counts = np.asarray(counts, dtype=np.int64).copy()
+
+    def chi_square(self) -> tuple[float, float]:
+        """
+        :return: the chi-square statistic and p-value of the histogram against the uniform distribution
+        """
+        from scipy import stats
+
+        # A float array, the counts are integers and n / bins need not be
+        expected_frequencies = np.full(len(self.counts), self.n / len(self.counts))
+        chi_stat, p_value = stats.chisquare(self.counts, expected_frequencies)
+        return chi_stat, p_value
+
+    def autocorrelation(self, lag: int = 1) -> float:
+        """
+        :return: the Pearson correlation between x[:-lag] and x[lag:], as np.corrcoef(x[:-lag], x[lag:])[0, 1]
+        """
+        if lag not in self.lags:
+            raise ValueError(f"lag {lag} is not accumulated, lags: {self.lags}")
+        pairs = self.n - lag
+        if pairs < 1:
+            return math.nan
+        # x[:-lag] leaves out the last `lag` values and x[lag:] the first `lag` ones
+        last, first = self.tail[len(self.tail) - lag:], self.head[:lag]
+        sum_x, sum_y = self.total - sum(last), self.total - sum(first)
+        sum_xx = self.total_squares - sum(v * v for v in last)
+        sum_yy = self.total_squares - sum(v * v for v in first)
+        covariance = pairs * self.lag_products[self.lags.index(lag)] - sum_x * sum_y
+        variance_x = pairs * sum_xx - sum_x ** 2
+        variance_y = pairs * sum_yy - sum_y ** 2
+        if variance_x == 0 or variance_y == 0:
+            return math.nan
+        return covariance / (math.sqrt(variance_x) * math.sqrt(variance_y))